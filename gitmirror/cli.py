@@ -1,8 +1,8 @@
 import sys
-import json
 import argparse
 import logging
 from .utils.logging import setup_logging
+from .utils.http import dumps_compact
 from .utils.config import load_config
 from .mirror import mirror_repository, process_all_repositories
 from .gitea.repository import get_gitea_repos
@@ -36,10 +36,15 @@ def main():
     # Handle --list-repos flag
     if args.list_repos:
         repos = get_gitea_repos(gitea_token, gitea_url)
-        if repos:
-            print(json.dumps(repos))
-        else:
-            print("[]")
+        # Stream the JSON array one repository at a time instead of
+        # serializing the whole listing into a single string first
+        out = sys.stdout
+        out.write('[')
+        for i, repo in enumerate(repos):
+            if i:
+                out.write(',')
+            out.write(dumps_compact(repo))
+        out.write(']\n')
         sys.exit(0)
     
     # Determine if metadata should be mirrored
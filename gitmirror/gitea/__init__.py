@@ -1,42 +1,54 @@
-# Repository functions
-from .repository import (
-    get_gitea_repos,
-    create_or_update_repo,
-    trigger_mirror_sync,
-    update_repo_description
-)
-
-# Release functions
-from .release import (
-    check_gitea_release_exists,
-    create_gitea_release,
-    delete_release,
-    mirror_release_asset,
-    verify_gitea_release
-)
-
-# Wiki functions
-from .wiki import mirror_github_wiki
-
-# Comment functions
-from .comment import mirror_github_issue_comments
-
-# Issue functions
-from .issue import (
-    mirror_github_issues,
-    delete_all_issues
-)
-
-# PR functions
-from .pr import (
-    mirror_github_prs,
-    mirror_github_pr_review_comments
-)
-
-# Metadata functions
-from .metadata import (
-    mirror_github_labels,
-    mirror_github_milestones,
-    mirror_github_metadata,
-    delete_all_issues_and_prs
-)
+import importlib
+
+# Map each public name to the submodule that provides it. Submodules are
+# imported lazily (PEP 562) so entry points that only need one of them —
+# e.g. the CLI's --list-repos, which touches nothing but repository — don't
+# pay the import cost of the whole package at startup.
+_LAZY_IMPORTS = {
+    # Repository functions
+    'get_gitea_repos': 'repository',
+    'create_or_update_repo': 'repository',
+    'trigger_mirror_sync': 'repository',
+    'update_repo_description': 'repository',
+
+    # Release functions
+    'check_gitea_release_exists': 'release',
+    'create_gitea_release': 'release',
+    'delete_release': 'release',
+    'mirror_release_asset': 'release',
+    'verify_gitea_release': 'release',
+
+    # Wiki functions
+    'mirror_github_wiki': 'wiki',
+
+    # Comment functions
+    'mirror_github_issue_comments': 'comment',
+
+    # Issue functions
+    'mirror_github_issues': 'issue',
+    'delete_all_issues': 'issue',
+
+    # PR functions
+    'mirror_github_prs': 'pr',
+    'mirror_github_pr_review_comments': 'pr',
+
+    # Metadata functions
+    'mirror_github_labels': 'metadata',
+    'mirror_github_milestones': 'metadata',
+    'mirror_github_metadata': 'metadata',
+    'delete_all_issues_and_prs': 'metadata',
+}
+
+
+def __getattr__(name):
+    submodule = _LAZY_IMPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f'.{submodule}', __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
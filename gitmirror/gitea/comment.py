@@ -1,8 +1,129 @@
+import hashlib
 import logging
+import re
+import threading
 import requests
+from itertools import chain
+from ..utils import http
 
 logger = logging.getLogger('github-gitea-mirror')
 
+# Marker embedded in every mirrored comment body carrying the GitHub
+# comment id; dedup keys on this id, which is stable across edits and
+# unique even when one author posts two comments with the same opening
+_GH_ID_RE = re.compile(r'<!-- gh-id:(\d+) -->')
+
+# Cheap C-level substring test applied before the fingerprint regex so
+# ordinary (non-mirrored) comments never reach the regex engine
+_FINGERPRINT_SENTINEL = '*Mirrored from GitHub comment by @'
+
+# Matches the header that mirrored comment bodies are created with below;
+# group 1 is the GitHub author, group 2 the first 50 characters of content
+_FINGERPRINT_RE = re.compile(
+    r'\*Mirrored from GitHub comment by @([^*]+)\*\n\n'
+    r'\*\*Created at: [^\n]*\*\*\n\n'
+    r'(.{0,50})',
+    re.DOTALL,
+)
+
+# Matches a '>' quote marker that is missing the space after it
+_QUOTE_FIX_RE = re.compile(r'(?m)^>(?! )(?=.)')
+
+# Per-issue signature of the GitHub comment set at the last successful
+# sync, keyed by (github_repo, Gitea target, issue number) — one GitHub
+# repo can mirror to several Gitea targets in a run, and each target
+# has to catch up on its own. The mirror runs as a long-lived service,
+# so when the signature hasn't changed we can skip paginating the
+# Gitea side entirely on re-syncs.
+_LAST_SYNCED = {}
+
+# Gitea comment listings shared within a run, keyed by issue. The issue
+# mirror and the PR review-comment mirror inspect the same issue's
+# comments back to back; caching the listing saves the second pagination.
+# Writers mark the entry stale after creating comments so the next
+# reader refetches. Repos in _prefilled_repos had their cache filled
+# from the repo-level comments listing, so an absent entry there means
+# the issue simply has no comments.
+_gitea_comments_cache = {}
+_prefilled_repos = set()
+_gitea_comments_lock = threading.Lock()
+
+# Trailing issue or PR number of a Gitea comment's issue_url
+_ISSUE_URL_NUM_RE = re.compile(r'/(?:issues|pulls)/(\d+)$')
+
+
+def prefill_gitea_comment_cache(gitea_token, gitea_url, gitea_owner, gitea_repo):
+    """Fill the per-issue comment cache from one repo-level listing
+
+    Gitea's /issues/comments endpoint returns the comments of every
+    issue in the repository; grouping them by issue number replaces one
+    full pagination per mirrored issue with a handful of requests for
+    the whole repo. Failures are logged and leave the per-issue path in
+    place.
+    """
+    gitea_headers = {'Authorization': f'token {gitea_token}'}
+    api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/issues/comments"
+    gitea_limit = http.get_gitea_page_limit(gitea_url, gitea_headers)
+
+    try:
+        all_comments = http.fetch_all_pages(api_url, gitea_headers, {'limit': gitea_limit})
+    except Exception as e:
+        logger.warning(f"Could not prefill the comment cache for {gitea_owner}/{gitea_repo}: {e}")
+        return
+
+    comments_by_issue = {}
+    for comment in all_comments:
+        url_match = _ISSUE_URL_NUM_RE.search(comment.get('issue_url') or comment.get('pull_request_url') or '')
+        if url_match:
+            comments_by_issue.setdefault(int(url_match.group(1)), []).append(comment)
+
+    with _gitea_comments_lock:
+        for issue_number, comments in comments_by_issue.items():
+            _gitea_comments_cache[(gitea_url, gitea_owner, gitea_repo, issue_number)] = comments
+        _prefilled_repos.add((gitea_url, gitea_owner, gitea_repo))
+
+    logger.info(f"Prefilled the comment cache for {gitea_owner}/{gitea_repo} with {len(all_comments)} comments across {len(comments_by_issue)} issues")
+
+
+def get_gitea_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, gitea_issue_number):
+    """List a Gitea issue's comments, cached per issue within this process"""
+    cache_key = (gitea_url, gitea_owner, gitea_repo, gitea_issue_number)
+    with _gitea_comments_lock:
+        cached = _gitea_comments_cache.get(cache_key)
+        if (cached is None and cache_key not in _gitea_comments_cache
+                and (gitea_url, gitea_owner, gitea_repo) in _prefilled_repos):
+            # The repo listing covered every issue, so no entry means
+            # this issue has no comments
+            cached = []
+    if cached is not None:
+        return cached
+
+    gitea_headers = {'Authorization': f'token {gitea_token}'}
+    gitea_api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/issues/{gitea_issue_number}/comments"
+    gitea_limit = http.get_gitea_page_limit(gitea_url, gitea_headers)
+    comments = http.fetch_all_pages(gitea_api_url, gitea_headers, {'limit': gitea_limit})
+
+    with _gitea_comments_lock:
+        _gitea_comments_cache[cache_key] = comments
+    return comments
+
+
+def forget_gitea_issue_comments(gitea_url, gitea_owner, gitea_repo, gitea_issue_number):
+    """Mark an issue's cached comment listing stale after writing to it"""
+    with _gitea_comments_lock:
+        _gitea_comments_cache[(gitea_url, gitea_owner, gitea_repo, gitea_issue_number)] = None
+
+
+def _fingerprint_hash(fingerprint):
+    """Collapse a fingerprint string to a 64-bit int
+
+    Storing 8-byte integers instead of author+preview strings keeps the
+    dedup set several times smaller on issues with very many comments; the
+    collision probability at this digest size is negligible for an
+    idempotent dedup that self-corrects on the next run.
+    """
+    return int.from_bytes(hashlib.blake2b(fingerprint.encode('utf-8'), digest_size=8).digest(), 'big')
+
 def mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, github_issue_number, gitea_issue_number, github_token=None):
     """Mirror comments from a GitHub issue to a Gitea issue"""
     logger.info(f"Mirroring comments for issue #{github_issue_number} from GitHub to Gitea issue #{gitea_issue_number}")
@@ -25,155 +146,123 @@ def mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo
     }
     
     try:
-        # Paginate through all comments
-        page = 1
-        all_comments = []
-        
-        while True:
-            params['page'] = page
-            logger.debug(f"Fetching GitHub comments page {page} for issue #{github_issue_number}")
-            response = requests.get(github_api_url, headers=github_headers, params=params)
-            response.raise_for_status()
-            
-            comments = response.json()
-            if not comments:
-                logger.debug(f"No more comments found on page {page}")
-                break  # No more comments
-                
-            logger.debug(f"Found {len(comments)} comments on page {page}")
-            all_comments.extend(comments)
-            
-            # Check if there are more pages
-            if len(comments) < params['per_page']:
-                break
-                
-            page += 1
-        
-        logger.info(f"Found {len(all_comments)} comments for GitHub issue #{github_issue_number}")
-        
-        if not all_comments:
+        # Stream comment pages instead of buffering the full comment list;
+        # the first page tells us whether there is anything to mirror at all
+        comment_pages = http.iter_pages(github_api_url, github_headers, params)
+        first_page = next(comment_pages, None)
+
+        if first_page is None:
             logger.info(f"No comments to mirror for GitHub issue #{github_issue_number}")
             return True
-        
+
+        all_comments = chain(first_page, chain.from_iterable(comment_pages))
+
+        # Skip the whole Gitea fetch when the GitHub comment set is
+        # unchanged since the last successful sync of this issue. The
+        # signature needs every comment's timestamp, so the stream is
+        # flattened here; the pages themselves were still fetched
+        # concurrently and revalidated via ETags above.
+        all_comments = list(all_comments)
+        newest_update = max((comment.get('updated_at') or '' for comment in all_comments), default='')
+        sync_signature = (newest_update, len(all_comments))
+
+        sync_key = (github_repo, gitea_url, gitea_owner, gitea_repo, github_issue_number)
+        if _LAST_SYNCED.get(sync_key) == sync_signature:
+            logger.info(f"No comment changes for GitHub issue #{github_issue_number} since last sync, skipping")
+            return True
+
         # Get existing comments in Gitea to avoid duplicates
         gitea_api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/issues/{gitea_issue_number}/comments"
         
         try:
-            # Get all comments with pagination
-            gitea_comments = []
-            gitea_page = 1
-            
-            while True:
-                logger.debug(f"Fetching Gitea comments page {gitea_page} for issue #{gitea_issue_number}")
-                gitea_comments_response = requests.get(
-                    gitea_api_url, 
-                    headers=gitea_headers, 
-                    params={'page': gitea_page, 'limit': 50}
-                )
-                gitea_comments_response.raise_for_status()
-                
-                page_comments = gitea_comments_response.json()
-                if not page_comments:
-                    break  # No more comments
-                    
-                gitea_comments.extend(page_comments)
-                
-                # Check if there are more pages
-                if len(page_comments) < 50:
-                    break
-                    
-                gitea_page += 1
-            
-            # Create a set of comment fingerprints to avoid duplicates
+            # Get all comments; the listing is shared with the PR
+            # review-comment mirror, which reads the same issue next
+            gitea_comments = get_gitea_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, gitea_issue_number)
+
+            # Collect the GitHub ids of comments we have already mirrored.
+            # Bodies written before the gh-id marker existed fall back to
+            # the author+preview fingerprint so old mirrors stay idempotent.
+            existing_gh_ids = set()
             existing_comment_fingerprints = set()
-            
             for comment in gitea_comments:
-                if comment['body'] and '*Mirrored from GitHub comment by @' in comment['body']:
-                    # Extract the GitHub comment fingerprint
-                    try:
-                        body_lines = comment['body'].split('\n')
-                        for i, line in enumerate(body_lines):
-                            if '*Mirrored from GitHub comment by @' in line:
-                                # Get the author from this line
-                                author = line.split('@')[1].split('*')[0]
-                                # Get the content from the next lines
-                                content_start = i + 3  # Skip the author line, created at line, and blank line
-                                if content_start < len(body_lines):
-                                    content = '\n'.join(body_lines[content_start:])
-                                    content_preview = content[:50]
-                                    fingerprint = f"{author}:{content_preview}"
-                                    existing_comment_fingerprints.add(fingerprint)
-                                break
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Failed to extract GitHub comment fingerprint: {e}")
+                body = comment['body'] or ''
+                id_match = _GH_ID_RE.search(body)
+                if id_match:
+                    existing_gh_ids.add(int(id_match.group(1)))
+                elif _FINGERPRINT_SENTINEL in body:
+                    match = _FINGERPRINT_RE.search(body)
+                    if match:
+                        existing_comment_fingerprints.add(_fingerprint_hash(f"{match.group(1)}:{match.group(2)}"))
             
-            # Mirror comments
+            # Collect the new comments first, then create them concurrently
+            new_comments = []
             created_count = 0
             skipped_count = 0
-            
+            had_errors = False
+
             for comment in all_comments:
                 try:
-                    # Create a fingerprint for this comment
+                    gh_id = comment['id']
                     author = comment['user']['login']
                     content = comment['body'] or ""
-                    content_preview = content[:50]
-                    fingerprint = f"{author}:{content_preview}"
-                    
-                    # Skip if we've already processed this comment
-                    if fingerprint in existing_comment_fingerprints:
+
+                    # Skip if we've already mirrored this comment, checking
+                    # the legacy fingerprint only for pre-gh-id mirrors
+                    if gh_id in existing_gh_ids or (
+                        existing_comment_fingerprints
+                        and _fingerprint_hash(f"{author}:{content[:50]}") in existing_comment_fingerprints
+                    ):
                         logger.debug(f"Skipping already processed GitHub comment by @{author}")
                         skipped_count += 1
                         continue
-                    
+
                     # Format the comment body
-                    comment_body = f"*Mirrored from GitHub comment by @{author}*\n\n"
+                    comment_body = f"<!-- gh-id:{gh_id} -->\n"
+                    comment_body += f"*Mirrored from GitHub comment by @{author}*\n\n"
                     comment_body += f"**Created at: {comment['created_at']}**\n\n"
-                    
-                    # Process the content to ensure proper formatting
+
+                    # Normalize line endings and ensure quotes have a space
+                    # after '>', in a single pass over the content
                     processed_content = content
-                    
-                    # Minimal processing for quoted content
                     if processed_content:
-                        # First, normalize line endings to just \n (no \r)
                         processed_content = processed_content.replace('\r\n', '\n').replace('\r', '\n')
-                        
-                        # Only ensure quotes have a space after '>'
-                        lines = processed_content.split('\n')
-                        for i in range(len(lines)):
-                            if lines[i].startswith('>') and not lines[i].startswith('> ') and len(lines[i]) > 1:
-                                lines[i] = '> ' + lines[i][1:]
-                        
-                        processed_content = '\n'.join(lines)
-                    
-                    # Add the processed content
-                    if processed_content:
-                        comment_body += processed_content
-                    
-                    # Create comment in Gitea
-                    comment_data = {
-                        'body': comment_body
-                    }
-                    
+                        comment_body += _QUOTE_FIX_RE.sub('> ', processed_content)
+
+                    new_comments.append((author, comment_body))
+
+                    # Add to our set of processed comments
+                    existing_gh_ids.add(gh_id)
+                except Exception as e:
+                    logger.error(f"Error processing comment: {e}")
+                    skipped_count += 1
+                    had_errors = True
+
+            # Create the comments one at a time, in GitHub order: Gitea
+            # sorts comments by creation time, so concurrent creates
+            # would shuffle the mirrored conversation. Parallelism
+            # across issues already comes from the issue worker pool.
+            if new_comments:
+                for author, comment_body in new_comments:
                     try:
-                        create_response = requests.post(gitea_api_url, headers=gitea_headers, json=comment_data)
+                        create_response = http.post(gitea_api_url, headers=gitea_headers, json={'body': comment_body})
                         create_response.raise_for_status()
-                        
                         created_count += 1
                         logger.info(f"Created comment in Gitea issue #{gitea_issue_number} by @{author}")
-                        
-                        # Add to our set of processed comments
-                        existing_comment_fingerprints.add(fingerprint)
                     except Exception as e:
-                        logger.error(f"Error creating comment in Gitea: {e}")
-                        logger.error(f"Response status: {getattr(create_response, 'status_code', 'unknown')}")
-                        logger.error(f"Response text: {getattr(create_response, 'text', 'unknown')}")
+                        logger.error(f"Error creating comment in Gitea by @{author}: {e}")
                         skipped_count += 1
-                except Exception as e:
-                    logger.error(f"Error processing comment: {e}")
-                    skipped_count += 1
-            
+                        had_errors = True
+                forget_gitea_issue_comments(gitea_url, gitea_owner, gitea_repo, gitea_issue_number)
+
             logger.info(f"Comments mirroring summary for issue #{github_issue_number}: {created_count} created, {skipped_count} skipped")
-            return True
+
+            # Only record the signature after a clean run so failed
+            # comments are retried on the next sync; report the partial
+            # failure so callers don't advance their own watermarks past
+            # this issue either
+            if not had_errors:
+                _LAST_SYNCED[sync_key] = sync_signature
+            return not had_errors
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Error getting existing comments from Gitea: {e}")
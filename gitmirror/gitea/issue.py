@@ -1,9 +1,97 @@
+import hashlib
 import logging
+import re
+from collections import Counter
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from ..utils import http
 from .comment import mirror_github_issue_comments
 
 logger = logging.getLogger('github-gitea-mirror')
 
+# Bound the number of issues being created/updated against Gitea at once
+MAX_ISSUE_WORKERS = 8
+
+# Bound the number of concurrent issue deletions against Gitea
+MAX_DELETE_WORKERS = 16
+
+# Matches both '*Mirrored from GitHub issue #123*' and
+# '*Mirrored from GitHub issue [#123](url)*' in one scan over the body
+_MIRROR_RE = re.compile(r'\*Mirrored from GitHub issue \[?#(\d+)')
+
+# Matches the [GH-...] marker that mirrored issue titles are prefixed with
+_TITLE_RE = re.compile(r'\[GH-([^\]]+)\]')
+
+# Newest GitHub updated_at seen at the last clean sync, keyed by
+# (github_repo, gitea_owner, gitea_repo). The mirror runs as a
+# long-lived service, so later runs pass it as the GitHub 'since'
+# parameter and only changed issues come back; unchanged pages are
+# additionally served from the shared ETag cache.
+_LAST_SYNC_TIME = {}
+
+def _body_hash(body):
+    """16-byte digest for comparing multi-KB issue bodies
+
+    Keeping a digest per existing issue instead of the full body makes
+    the no-op-update check a 16-byte comparison and avoids holding every
+    body in memory for the whole run.
+    """
+    return hashlib.blake2b(body.encode('utf-8'), digest_size=16).digest()
+
+# Formatted (title, body) payloads keyed by issue id with the update
+# time stored alongside, so issues that come around again unchanged —
+# e.g. a retry after a run with errors — skip the multi-KB formatting
+# work entirely; keying by id alone means an updated issue replaces its
+# stale entry instead of leaking next to it
+_PAYLOAD_CACHE = {}
+
+def _build_issue_payload(issue):
+    """Format the Gitea issue title and body for a GitHub issue
+
+    Pure string work with no I/O; the result only depends on the issue
+    payload, which is what makes caching by (id, updated_at) safe.
+    """
+    # Format the title with GitHub issue number
+    issue_title = f"[GH-{issue['number']}] {issue['title']}"
+
+    # Build the body as a list of parts and join once at the
+    # end; repeated str += reallocates the whole body each time
+    parts = [
+        # Create a prominent link at the top of the issue body
+        f"*Mirrored from GitHub issue [#{issue['number']}]({issue['html_url']})*\n\n",
+        f"**Original author: @{issue['user']['login']}**\n\n",
+        f"**Created at: {issue['created_at']}**\n\n",
+    ]
+
+    # Add labels
+    if issue['labels']:
+        parts.append("**Labels:** " + " ".join(f"`{label['name']}`" for label in issue['labels']) + " \n\n")
+
+    # Add milestone
+    if issue['milestone']:
+        parts.append(f"**Milestone:** {issue['milestone']['title']}\n\n")
+
+    # Add assignees
+    if issue['assignees']:
+        parts.append("**Assignees:** " + " ".join(f"@{assignee['login']}" for assignee in issue['assignees']) + " \n\n")
+
+    # Add the original issue body
+    if issue['body']:
+        parts.append(f"## Description\n\n{issue['body']}\n\n")
+
+    return issue_title, "".join(parts)
+
+def _iter_all_gitea_issues(gitea_api_url, gitea_url, gitea_headers):
+    """Yield every issue in a Gitea repository
+
+    Single shared listing path for the mirror and delete flows: one hot
+    code object for the interpreter to specialize, and one place that
+    knows about the state=all params and the probed server page limit.
+    """
+    gitea_limit = http.get_gitea_page_limit(gitea_url, gitea_headers)
+    for page_items in http.iter_pages(gitea_api_url, gitea_headers, {'state': 'all', 'limit': gitea_limit}):
+        yield from page_items
+
 def mirror_github_issues(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, github_token=None):
     """Mirror issues from GitHub to Gitea"""
     logger.info(f"Mirroring issues from GitHub repository {github_repo} to Gitea repository {gitea_owner}/{gitea_repo}")
@@ -25,317 +113,291 @@ def mirror_github_issues(gitea_token, gitea_url, gitea_owner, gitea_repo, github
         'state': 'all',  # Get both open and closed issues
         'per_page': 100,  # Maximum allowed by GitHub API
     }
-    
+
+    # Only ask GitHub for issues updated since the last clean sync
+    sync_key = (github_repo, gitea_owner, gitea_repo)
+    last_sync = _LAST_SYNC_TIME.get(sync_key)
+    if last_sync:
+        params['since'] = last_sync
+
     try:
-        # Paginate through all issues
-        page = 1
-        all_issues = []
-        
-        while True:
-            params['page'] = page
-            response = requests.get(github_api_url, headers=github_headers, params=params)
-            response.raise_for_status()
-            
-            issues = response.json()
-            if not issues:
-                break  # No more issues
-                
-            all_issues.extend([issue for issue in issues if 'pull_request' not in issue])  # Filter out PRs
-            
-            # Check if there are more pages
-            if len(issues) < params['per_page']:
-                break
-                
-            page += 1
-        
-        logger.info(f"Found {len(all_issues)} issues in GitHub repository {github_repo}")
-        
-        # Count open and closed issues
-        open_issues = sum(1 for issue in all_issues if issue['state'] == 'open')
-        closed_issues = sum(1 for issue in all_issues if issue['state'] == 'closed')
-        logger.info(f"GitHub issues breakdown: {open_issues} open, {closed_issues} closed")
-        
+        # Stream issues page by page rather than materializing the full
+        # listing; pages 2..last still arrive in parallel once the first
+        # page's Link header reveals the count, and mirroring can start
+        # as soon as the first page lands
+        gh_state_counts = Counter()
+        newest_update = last_sync or ''
+
+        def iter_github_issues():
+            nonlocal newest_update
+            for page_items in http.iter_pages(github_api_url, github_headers, params):
+                for issue in page_items:
+                    if 'pull_request' in issue:  # Filter out PRs
+                        continue
+                    gh_state_counts[issue['state']] += 1
+                    if (issue.get('updated_at') or '') > newest_update:
+                        newest_update = issue['updated_at']
+                    yield issue
+
         # Create issues in Gitea
         gitea_api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/issues"
         
         # Get existing issues in Gitea to avoid duplicates
         existing_issues = {}
-        existing_titles = {}
-        existing_gh_numbers = set()
-        
+        # GitHub number parsed from a [GH-N] title marker -> Gitea number,
+        # so the fallback match is a hash lookup instead of scanning every
+        # existing title per incoming issue
+        marker_index = {}
+        # Gitea number -> (title, body digest, state) of the issue as it
+        # stands, so updates that would change nothing can be skipped
+        gitea_issue_details = {}
+
         try:
-            # Get all issues with pagination
-            gitea_issues = []
-            gitea_page = 1
-            
-            while True:
-                gitea_issues_response = requests.get(
-                    gitea_api_url, 
-                    headers=gitea_headers, 
-                    params={'state': 'all', 'page': gitea_page, 'limit': 50}
-                )
-                gitea_issues_response.raise_for_status()
-                
-                page_issues = gitea_issues_response.json()
-                if not page_issues:
-                    break  # No more issues
-                    
-                gitea_issues.extend(page_issues)
-                
-                # Check if there are more pages
-                if len(page_issues) < 50:
-                    break
-                    
-                gitea_page += 1
-            
-            logger.info(f"Found {len(gitea_issues)} existing issues in Gitea repository {gitea_owner}/{gitea_repo}")
-            
-            # Count open and closed issues in Gitea
-            gitea_open_issues = sum(1 for issue in gitea_issues if issue['state'] == 'open')
-            gitea_closed_issues = sum(1 for issue in gitea_issues if issue['state'] == 'closed')
-            logger.info(f"Gitea issues breakdown before mirroring: {gitea_open_issues} open, {gitea_closed_issues} closed")
-            
-            # Create a mapping of GitHub issue numbers to Gitea issue numbers
-            for issue in gitea_issues:
+            # Stream the existing issues, counting and building the
+            # GitHub-number mapping in a single pass over each page. On a
+            # fresh mirror target the first page comes back empty and the
+            # whole existing-issue phase costs exactly one round-trip,
+            # leaving every map empty and the matching logic a no-op.
+            gitea_issue_count = 0
+            gitea_state_counts = Counter()
+
+            for issue in _iter_all_gitea_issues(gitea_api_url, gitea_url, gitea_headers):
+                gitea_issue_count += 1
+                gitea_state_counts[issue['state']] += 1
+
                 # Look for the GitHub issue number in the body
-                github_issue_num = None
-                
                 if issue['body']:
-                    # Try to extract GitHub issue number from the body
-                    body_lines = issue['body'].split('\n')
-                    for line in body_lines:
-                        if '*Mirrored from GitHub issue' in line:
-                            try:
-                                # Extract the GitHub issue number - handle both formats
-                                # *Mirrored from GitHub issue #123*
-                                # *Mirrored from GitHub issue [#123](url)*
-                                if '#' in line:
-                                    # Extract number after # and before closing * or ]
-                                    num_text = line.split('#')[1]
-                                    if ']' in num_text:
-                                        github_issue_num = int(num_text.split(']')[0])
-                                    elif '*' in num_text:
-                                        github_issue_num = int(num_text.split('*')[0])
-                                    else:
-                                        github_issue_num = int(num_text.strip())
-                                    
-                                    if github_issue_num:
-                                        existing_issues[github_issue_num] = issue['number']
-                                        existing_gh_numbers.add(github_issue_num)
-                                        break
-                            except (ValueError, IndexError) as e:
-                                logger.warning(f"Failed to extract GitHub issue number from body: {e}")
-                
+                    body_match = _MIRROR_RE.search(issue['body'])
+                    if body_match:
+                        github_issue_num = int(body_match.group(1))
+                        existing_issues[github_issue_num] = issue['number']
+
                 # Also check title for [GH-123] format
-                if issue['title'] and '[GH-' in issue['title']:
-                    try:
-                        title_parts = issue['title'].split('[GH-')
-                        if len(title_parts) > 1:
-                            num_part = title_parts[1].split(']')[0]
-                            # Handle PR references like 'PR-31'
-                            if num_part.startswith('PR-'):
-                                # This is a PR reference, not an issue reference
-                                # Skip it as it will be handled by the PR module
-                                pass
-                            else:
-                                # Try to convert to integer, but handle non-numeric values
-                                try:
-                                    gh_num = int(num_part)
-                                    existing_issues[gh_num] = issue['number']
-                                    existing_gh_numbers.add(gh_num)
-                                except ValueError:
-                                    logger.warning(f"Non-numeric issue reference in title: {num_part}")
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Failed to extract GitHub issue number from title: {e}")
-                
-                # Store title mapping as fallback
-                existing_titles[issue['title']] = issue['number']
+                title_match = _TITLE_RE.search(issue['title']) if issue['title'] else None
+                if title_match:
+                    num_part = title_match.group(1)
+                    # Handle PR references like 'PR-31'
+                    if num_part.startswith('PR-'):
+                        # This is a PR reference, not an issue reference
+                        # Skip it as it will be handled by the PR module
+                        pass
+                    else:
+                        # Try to convert to integer, but handle non-numeric values
+                        try:
+                            gh_num = int(num_part)
+                            existing_issues[gh_num] = issue['number']
+                            marker_index[gh_num] = issue['number']
+                        except ValueError:
+                            logger.warning(f"Non-numeric issue reference in title: {num_part}")
+
+                gitea_issue_details[issue['number']] = (issue['title'], _body_hash(issue['body'] or ''), issue['state'])
+
+            logger.info(f"Found {gitea_issue_count} existing issues in Gitea repository {gitea_owner}/{gitea_repo}")
+            logger.info(f"Gitea issues breakdown before mirroring: {gitea_state_counts['open']} open, {gitea_state_counts['closed']} closed")
         except Exception as e:
             logger.warning(f"Error getting existing issues from Gitea: {e}")
         
-        # Mirror issues
+        # Mirror issues. Each issue's create/update and comment mirroring is
+        # independent I/O — GitHub never lists the same issue number twice —
+        # so the per-issue work runs on a worker pool and the shared maps
+        # are only ever written under distinct keys.
         created_count = 0
         updated_count = 0
         skipped_count = 0
-        
-        for issue in all_issues:
+        # Set when any issue's comment mirroring reports failure, so the
+        # 'since' watermark is not advanced past comments that still
+        # need to be retried
+        comment_failures = False
+
+        def mirror_issue(issue):
+            nonlocal comment_failures
             try:
-                # Format the title with GitHub issue number
-                issue_title = f"[GH-{issue['number']}] {issue['title']}"
-                
-                # Create a prominent link at the top of the issue body
-                issue_body = f"*Mirrored from GitHub issue [#{issue['number']}]({issue['html_url']})*\n\n"
-                issue_body += f"**Original author: @{issue['user']['login']}**\n\n"
-                issue_body += f"**Created at: {issue['created_at']}**\n\n"
-                
-                # Add labels
-                if issue['labels']:
-                    issue_body += "**Labels:** "
-                    for label in issue['labels']:
-                        issue_body += f"`{label['name']}` "
-                    issue_body += "\n\n"
-                
-                # Add milestone
-                if issue['milestone']:
-                    issue_body += f"**Milestone:** {issue['milestone']['title']}\n\n"
-                
-                # Add assignees
-                if issue['assignees']:
-                    issue_body += "**Assignees:** "
-                    for assignee in issue['assignees']:
-                        issue_body += f"@{assignee['login']} "
-                    issue_body += "\n\n"
-                
-                # Add the original issue body
-                if issue['body']:
-                    issue_body += f"## Description\n\n{issue['body']}\n\n"
-                
-                # Skip if we've already processed this GitHub issue number in this run
-                if issue['number'] in existing_gh_numbers:
-                    logger.debug(f"Skipping already processed GitHub issue #{issue['number']}")
-                    skipped_count += 1
-                    continue
-                
+                cached = _PAYLOAD_CACHE.get(issue.get('id'))
+                if cached is not None and cached[0] == issue.get('updated_at'):
+                    payload = cached[1]
+                else:
+                    payload = _build_issue_payload(issue)
+                    if issue.get('id') is not None and issue.get('updated_at') is not None:
+                        _PAYLOAD_CACHE[issue['id']] = (issue['updated_at'], payload)
+                issue_title, issue_body = payload
+
+                def update_is_noop(gitea_number):
+                    details = gitea_issue_details.get(gitea_number)
+                    if details is None:
+                        return False
+                    existing_title, existing_body_digest, existing_state = details
+                    # A PATCH only ever closes, never reopens, so an open
+                    # GitHub issue matches whatever state Gitea has
+                    return (
+                        existing_title == issue_title
+                        and existing_body_digest == _body_hash(issue_body)
+                        and (issue['state'] != 'closed' or existing_state == 'closed')
+                    )
+
                 # Check if issue already exists in Gitea by GitHub issue number
                 if issue['number'] in existing_issues:
                     # Update existing issue
                     gitea_issue_number = existing_issues[issue['number']]
+
+                    # Skip the write when the mirrored copy already matches
+                    if update_is_noop(gitea_issue_number):
+                        logger.debug(f"Issue already up to date in Gitea, skipping: {issue_title}")
+                        if issue.get('comments', 0) > 0:
+                            if not mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, issue['number'], gitea_issue_number, github_token):
+                                comment_failures = True
+                        return 'skipped', None
+
                     update_url = f"{gitea_api_url}/{gitea_issue_number}"
-                    
+
+                    # Whether this update closes a currently open issue,
+                    # for the derived post-mirroring breakdown
+                    closes_open_issue = (
+                        issue['state'] == 'closed'
+                        and gitea_issue_details.get(gitea_issue_number, (None, None, None))[2] == 'open'
+                    )
+
                     # Prepare issue data
                     issue_data = {
                         'title': issue_title,
                         'body': issue_body,
                     }
-                    
+
                     # Handle state properly for Gitea API
                     if issue['state'] == 'closed':
                         issue_data['state'] = 'closed'
-                    
+
                     try:
                         # Don't use Sudo parameter as it's causing 404 errors when the user doesn't exist in Gitea
-                        update_response = requests.patch(update_url, headers=gitea_headers, json=issue_data)
+                        # Serialize once up front; the retrying adapter replays
+                        # these same bytes on transient failures
+                        update_response = http.patch(update_url, headers=gitea_headers, data=http.dumps_bytes(issue_data))
                         update_response.raise_for_status()
-                        updated_count += 1
                         logger.debug(f"Updated issue in Gitea: {issue_title} (state: {issue['state']})")
-                        
-                        # Mark as processed
-                        existing_gh_numbers.add(issue['number'])
-                        
-                        # Mirror comments for this issue
-                        mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, issue['number'], gitea_issue_number, github_token)
+
+                        # Mirror comments for this issue, skipping the
+                        # round-trip when GitHub says there are none
+                        if issue.get('comments', 0) > 0:
+                            if not mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, issue['number'], gitea_issue_number, github_token):
+                                comment_failures = True
+                        return 'updated', closes_open_issue
                     except Exception as e:
                         logger.error(f"Error updating issue in Gitea: {e}")
-                        skipped_count += 1
+                        return 'error', None
                 else:
-                    # Look for an existing issue with the exact issue number marker in the title
-                    issue_number_marker = f"[GH-{issue['number']}]"
-                    found_matching_issue = False
-                    
-                    for existing_title, gitea_num in existing_titles.items():
-                        if issue_number_marker in existing_title:
-                            # Found a title with the correct issue number, update it
-                            update_url = f"{gitea_api_url}/{gitea_num}"
-                            
-                            # Prepare issue data
-                            issue_data = {
-                                'title': issue_title,
-                                'body': issue_body,
-                            }
-                            
-                            # Handle state properly for Gitea API
-                            if issue['state'] == 'closed':
-                                issue_data['state'] = 'closed'
-                            
-                            try:
-                                update_response = requests.patch(update_url, headers=gitea_headers, json=issue_data)
-                                update_response.raise_for_status()
-                                updated_count += 1
-                                logger.debug(f"Updated issue in Gitea by title match: {issue_title} (state: {issue['state']})")
-                                
-                                # Mark as processed
-                                existing_gh_numbers.add(issue['number'])
-                                existing_issues[issue['number']] = gitea_num
-                                
-                                # Mirror comments for this issue
-                                mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, issue['number'], gitea_num, github_token)
-                                
-                                found_matching_issue = True
-                                break
-                            except Exception as e:
-                                logger.error(f"Error updating issue in Gitea by title match: {e}")
-                                # Continue to try creating a new issue
-                    
-                    if found_matching_issue:
-                        continue
-                    
+                    # Look for an existing issue carrying this issue number
+                    # in its title marker
+                    gitea_num = marker_index.get(issue['number'])
+                    if gitea_num is not None and update_is_noop(gitea_num):
+                        logger.debug(f"Issue already up to date in Gitea, skipping: {issue_title}")
+                        existing_issues[issue['number']] = gitea_num
+                        if issue.get('comments', 0) > 0:
+                            if not mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, issue['number'], gitea_num, github_token):
+                                comment_failures = True
+                        return 'skipped', None
+                    if gitea_num is not None:
+                        # Found a title with the correct issue number, update it
+                        update_url = f"{gitea_api_url}/{gitea_num}"
+                        closes_open_issue = (
+                            issue['state'] == 'closed'
+                            and gitea_issue_details.get(gitea_num, (None, None, None))[2] == 'open'
+                        )
+
+                        # Prepare issue data
+                        issue_data = {
+                            'title': issue_title,
+                            'body': issue_body,
+                        }
+
+                        # Handle state properly for Gitea API
+                        if issue['state'] == 'closed':
+                            issue_data['state'] = 'closed'
+
+                        try:
+                            update_response = http.patch(update_url, headers=gitea_headers, data=http.dumps_bytes(issue_data))
+                            update_response.raise_for_status()
+                            logger.debug(f"Updated issue in Gitea by title match: {issue_title} (state: {issue['state']})")
+
+                            # Mark as processed
+                            existing_issues[issue['number']] = gitea_num
+
+                            # Mirror comments for this issue, skipping the
+                            # round-trip when GitHub says there are none
+                            if issue.get('comments', 0) > 0:
+                                if not mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, issue['number'], gitea_num, github_token):
+                                    comment_failures = True
+                            return 'updated', closes_open_issue
+                        except Exception as e:
+                            logger.error(f"Error updating issue in Gitea by title match: {e}")
+                            # Continue to try creating a new issue
+
                     # Create a new issue
                     # Prepare issue data
                     issue_data = {
                         'title': issue_title,
                         'body': issue_body,
                     }
-                    
+
                     # Handle state properly for Gitea API
                     if issue['state'] == 'closed':
                         issue_data['state'] = 'closed'
-                    
+
                     try:
                         # Don't use Sudo parameter as it's causing 404 errors when the user doesn't exist in Gitea
-                        create_response = requests.post(gitea_api_url, headers=gitea_headers, json=issue_data)
+                        create_response = http.post(gitea_api_url, headers=gitea_headers, json=issue_data)
                         create_response.raise_for_status()
-                        
+
                         # Add the newly created issue to our mapping to avoid duplicates in the same run
-                        new_issue = create_response.json()
+                        new_issue = http.decode_json(create_response)
                         existing_issues[issue['number']] = new_issue['number']
-                        existing_titles[issue_title] = new_issue['number']
-                        existing_gh_numbers.add(issue['number'])
-                        
-                        created_count += 1
+                        marker_index[issue['number']] = new_issue['number']
+
                         logger.info(f"Created issue in Gitea: {issue_title} (state: {issue['state']})")
-                        
-                        # Mirror comments for this issue
-                        mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, issue['number'], new_issue['number'], github_token)
+
+                        # Mirror comments for this issue, skipping the
+                        # round-trip when GitHub says there are none
+                        if issue.get('comments', 0) > 0:
+                            if not mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, issue['number'], new_issue['number'], github_token):
+                                comment_failures = True
+                        return 'created', issue['state']
                     except Exception as e:
                         logger.error(f"Error creating issue in Gitea: {e}")
-                        skipped_count += 1
+                        return 'error', None
             except Exception as e:
                 logger.error(f"Error processing issue: {e}")
-                skipped_count += 1
-        
+                return 'error', None
+
+        had_errors = False
+        created_states = Counter()
+        closed_transitions = 0
+        with ThreadPoolExecutor(max_workers=MAX_ISSUE_WORKERS) as executor:
+            for outcome, detail in executor.map(mirror_issue, iter_github_issues()):
+                if outcome == 'created':
+                    created_count += 1
+                    created_states[detail] += 1
+                elif outcome == 'updated':
+                    updated_count += 1
+                    if detail:
+                        closed_transitions += 1
+                else:
+                    skipped_count += 1
+                    if outcome == 'error':
+                        had_errors = True
+
+        # Only advance the watermark after a clean run - including the
+        # comment mirroring - so failed issues and comments are picked
+        # up again on the next sync
+        if not had_errors and not comment_failures and newest_update:
+            _LAST_SYNC_TIME[sync_key] = newest_update
+
+        logger.info(f"Found {sum(gh_state_counts.values())} issues in GitHub repository {github_repo}")
+        logger.info(f"GitHub issues breakdown: {gh_state_counts['open']} open, {gh_state_counts['closed']} closed")
         logger.info(f"Issues mirroring summary: {created_count} created, {updated_count} updated, {skipped_count} skipped")
         
-        # Get final count of issues in Gitea after mirroring
-        try:
-            gitea_issues_after = []
-            gitea_page = 1
-            
-            while True:
-                gitea_issues_response = requests.get(
-                    gitea_api_url, 
-                    headers=gitea_headers, 
-                    params={'state': 'all', 'page': gitea_page, 'limit': 50}
-                )
-                gitea_issues_response.raise_for_status()
-                
-                page_issues = gitea_issues_response.json()
-                if not page_issues:
-                    break  # No more issues
-                    
-                gitea_issues_after.extend(page_issues)
-                
-                # Check if there are more pages
-                if len(page_issues) < 50:
-                    break
-                    
-                gitea_page += 1
-            
-            # Count open and closed issues in Gitea after mirroring
-            gitea_open_issues_after = sum(1 for issue in gitea_issues_after if issue['state'] == 'open')
-            gitea_closed_issues_after = sum(1 for issue in gitea_issues_after if issue['state'] == 'closed')
-            logger.info(f"Gitea issues breakdown after mirroring: {gitea_open_issues_after} open, {gitea_closed_issues_after} closed")
-        except Exception as e:
-            logger.error(f"Error getting final issue counts: {e}")
+        # Derive the post-mirroring breakdown from the counters already in
+        # hand instead of re-paginating the whole Gitea listing for a log line
+        final_open = gitea_state_counts['open'] - closed_transitions + created_states['open']
+        final_closed = gitea_state_counts['closed'] + closed_transitions + created_states['closed']
+        logger.info(f"Gitea issues breakdown after mirroring: {final_open} open, {final_closed} closed")
         
         return True
         
@@ -357,68 +419,50 @@ def delete_all_issues(gitea_token, gitea_url, gitea_owner, gitea_repo):
     gitea_api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/issues"
     
     try:
-        # Get all issues with pagination
-        gitea_issues = []
-        gitea_page = 1
-        
-        while True:
-            gitea_issues_response = requests.get(
-                gitea_api_url, 
-                headers=gitea_headers, 
-                params={'state': 'all', 'page': gitea_page, 'limit': 50}
-            )
-            gitea_issues_response.raise_for_status()
-            
-            page_issues = gitea_issues_response.json()
-            if not page_issues:
-                break  # No more issues
-                
-            gitea_issues.extend(page_issues)
-            
-            # Check if there are more pages
-            if len(page_issues) < 50:
-                break
-                
-            gitea_page += 1
-        
-        logger.info(f"Found {len(gitea_issues)} issues to delete in Gitea repository {gitea_owner}/{gitea_repo}")
-        
-        # Delete each issue
+        # Stream the issues page by page and delete them concurrently;
+        # the deletes are independent so wall time drops from one RTT per
+        # issue to roughly total/workers
         deleted_count = 0
         failed_count = 0
-        
-        for issue in gitea_issues:
+
+        def delete_issue(issue):
             issue_number = issue['number']
             delete_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/issues/{issue_number}"
-            
+
             try:
                 # Use the standard Gitea API to delete the issue
-                delete_response = requests.delete(delete_url, headers=gitea_headers)
-                
+                delete_response = http.delete(delete_url, headers=gitea_headers)
+
                 if delete_response.status_code in [200, 204]:
                     logger.debug(f"Successfully deleted issue #{issue_number}")
-                    deleted_count += 1
-                else:
-                    # If direct deletion fails, try closing the issue as a fallback
-                    logger.warning(f"Could not delete issue #{issue_number} (status code: {delete_response.status_code}), attempting to close it instead")
-                    
-                    # Close the issue with a note
-                    close_data = {
-                        'state': 'closed',
-                        'body': issue.get('body', '') + '\n\n*This issue was automatically closed during repository cleanup.*'
-                    }
-                    
-                    close_response = requests.patch(delete_url, headers=gitea_headers, json=close_data)
-                    if close_response.status_code in [200, 201, 204]:
-                        logger.warning(f"Issue #{issue_number} was closed but could not be deleted")
-                        deleted_count += 1  # Count as deleted since it was at least closed
-                    else:
-                        logger.error(f"Failed to close issue #{issue_number} (status code: {close_response.status_code})")
-                        failed_count += 1
+                    return True
+                # If direct deletion fails, try closing the issue as a fallback
+                logger.warning(f"Could not delete issue #{issue_number} (status code: {delete_response.status_code}), attempting to close it instead")
+
+                # Close the issue with a note
+                close_data = {
+                    'state': 'closed',
+                    'body': issue.get('body', '') + '\n\n*This issue was automatically closed during repository cleanup.*'
+                }
+
+                close_response = http.patch(delete_url, headers=gitea_headers, json=close_data)
+                if close_response.status_code in [200, 201, 204]:
+                    logger.warning(f"Issue #{issue_number} was closed but could not be deleted")
+                    return True  # Count as deleted since it was at least closed
+                logger.error(f"Failed to close issue #{issue_number} (status code: {close_response.status_code})")
+                return False
             except Exception as e:
                 logger.error(f"Error deleting issue #{issue_number}: {e}")
-                failed_count += 1
-        
+                return False
+
+        issues = _iter_all_gitea_issues(gitea_api_url, gitea_url, gitea_headers)
+        with ThreadPoolExecutor(max_workers=MAX_DELETE_WORKERS) as executor:
+            for deleted in executor.map(delete_issue, issues):
+                if deleted:
+                    deleted_count += 1
+                else:
+                    failed_count += 1
+
         logger.info(f"Issues deletion summary: {deleted_count} deleted/closed, {failed_count} failed")
         return True, deleted_count, failed_count
         
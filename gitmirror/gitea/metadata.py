@@ -1,9 +1,75 @@
+import functools
 import logging
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from ..utils import http
+from ..utils import config as config_module
 from ..utils.config import get_repo_config
 
 logger = logging.getLogger('github-gitea-mirror')
 
+# Short-lived cache of GitHub label/milestone lists keyed by
+# (github_repo, endpoint). When one run mirrors several Gitea targets
+# from the same source repo, only the first target pays the GitHub
+# fetch; the TTL keeps the data fresh across scheduler runs.
+_GH_LIST_CACHE = {}
+_GH_LIST_LOCK = threading.Lock()
+_GH_LIST_TTL = 60
+
+
+def _normalize_due_on(value):
+    """Collapse an ISO-8601 due date to its date part for comparison
+
+    GitHub and Gitea report the same deadline with different timezone
+    suffixes and fractional seconds, so the date alone is the stable
+    part of the value.
+    """
+    return value[:10] if value else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_repo_config(github_repo, gitea_owner, gitea_repo):
+    """Read a repo config once per process instead of once per mirror
+
+    Metadata mirroring for the same target re-reads the same small JSON
+    file on every scheduler run; the cache is dropped whenever any repo
+    config is saved, so edits from the web UI are picked up immediately.
+    """
+    return get_repo_config(github_repo, gitea_owner, gitea_repo)
+
+
+config_module._config_read_caches.append(_cached_repo_config)
+
+
+def _cached_github_list(key, fetch):
+    """Return the GitHub listing for key, fetching at most once per TTL window"""
+    now = time.monotonic()
+    with _GH_LIST_LOCK:
+        hit = _GH_LIST_CACHE.get(key)
+        if hit and now - hit[0] < _GH_LIST_TTL:
+            return hit[1]
+
+    data = fetch()
+    with _GH_LIST_LOCK:
+        _GH_LIST_CACHE[key] = (time.monotonic(), data)
+    return data
+
+# Payload templates copied per item; dict.copy() shares the key table
+# instead of re-hashing every key the way a fresh dict literal does
+_LABEL_TEMPLATE = {'name': '', 'color': '', 'description': ''}
+_MILESTONE_TEMPLATE = {'title': '', 'description': '', 'state': '', 'due_on': None}
+
+# Bound the number of concurrent label/milestone requests against Gitea.
+# Thread pools rather than an async client: the whole mirror stack is
+# synchronous requests code, and at these item counts the pools already
+# leave the network round-trip as the only cost that matters.
+MAX_METADATA_WORKERS = 8
+
+# Deletion is a lighter per-request operation, so allow more in flight
+MAX_DELETE_WORKERS = 16
+
 def mirror_github_labels(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, github_token=None):
     """Mirror labels from GitHub to Gitea"""
     logger.info(f"Mirroring labels from GitHub repository {github_repo} to Gitea repository {gitea_owner}/{gitea_repo}")
@@ -13,75 +79,105 @@ def mirror_github_labels(gitea_token, gitea_url, gitea_owner, gitea_repo, github
     if github_token:
         github_headers['Authorization'] = f'token {github_token}'
     
-    # Gitea API headers
+    # Gitea API headers; Content-Type only matters on requests with a
+    # body, so the read form stays minimal
     gitea_headers = {
         'Authorization': f'token {gitea_token}',
-        'Content-Type': 'application/json',
     }
+    gitea_write_headers = {**gitea_headers, 'Content-Type': 'application/json'}
     
     # Get labels from GitHub
     github_api_url = f"https://api.github.com/repos/{github_repo}/labels"
     
     try:
-        response = requests.get(github_api_url, headers=github_headers)
-        response.raise_for_status()
-        
-        github_labels = response.json()
+        # Revalidate with If-None-Match so unchanged label lists cost a
+        # 304 instead of a body download (and no GitHub rate-limit quota);
+        # targets mirrored from the same source repo within the TTL skip
+        # even that round-trip
+        github_labels = _cached_github_list(
+            (github_repo, 'labels'),
+            lambda: http.get_json_cached(github_api_url, headers=github_headers)[0],
+        )
         logger.info(f"Found {len(github_labels)} labels in GitHub repository {github_repo}")
-        
+
         # Get existing labels in Gitea
         gitea_api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/labels"
-        gitea_labels_response = requests.get(gitea_api_url, headers=gitea_headers)
-        gitea_labels_response.raise_for_status()
-        
-        gitea_labels = gitea_labels_response.json()
+        # Index in one pass over the parsed list. Incremental parsing
+        # (ijson over the raw stream) would save the intermediate list,
+        # but the ETag cache needs the whole parsed document anyway and
+        # label/milestone lists are small, so the list stays.
+        gitea_labels, _ = http.get_json_cached(gitea_api_url, headers=gitea_headers)
         existing_labels = {label['name']: label for label in gitea_labels}
+
+        # Build the per-item URL base once instead of re-interpolating the
+        # full endpoint for every label
+        update_base = gitea_api_url + '/'
         
         # Mirror labels
         created_count = 0
         updated_count = 0
+        unchanged_count = 0
         skipped_count = 0
-        
-        for label in github_labels:
+
+        def upsert_label(label):
             # Check if label already exists in Gitea
             if label['name'] in existing_labels:
-                # Update existing label
                 gitea_label = existing_labels[label['name']]
-                update_url = f"{gitea_api_url}/{gitea_label['id']}"
-                
+
+                # Skip the PATCH when the Gitea label already matches;
+                # on steady-state mirrors that is almost every label
+                if (gitea_label['color'] == label['color']
+                        and (gitea_label.get('description') or '') == (label.get('description') or '')):
+                    logger.debug("Label unchanged in Gitea: %s", label['name'])
+                    return 'unchanged'
+
+                # Update existing label
+                update_url = update_base + str(gitea_label['id'])
+
                 # Prepare label data
-                label_data = {
-                    'name': label['name'],
-                    'color': label['color'],
-                    'description': label.get('description', ''),
-                }
-                
+                label_data = _LABEL_TEMPLATE.copy()
+                label_data['name'] = label['name']
+                label_data['color'] = label['color']
+                label_data['description'] = label.get('description', '')
+
                 try:
-                    update_response = requests.patch(update_url, headers=gitea_headers, json=label_data)
+                    update_response = http.patch(update_url, headers=gitea_write_headers, data=http.dumps_bytes(label_data))
                     update_response.raise_for_status()
-                    updated_count += 1
-                    logger.debug(f"Updated label in Gitea: {label['name']}")
+                    logger.debug("Updated label in Gitea: %s", label['name'])
+                    return 'updated'
                 except Exception as e:
-                    logger.error(f"Error updating label in Gitea: {e}")
-                    skipped_count += 1
+                    logger.error("Error updating label in Gitea: %s", e)
+                    return 'skipped'
             else:
                 # Create new label
-                label_data = {
-                    'name': label['name'],
-                    'color': label['color'],
-                    'description': label.get('description', ''),
-                }
-                
+                label_data = _LABEL_TEMPLATE.copy()
+                label_data['name'] = label['name']
+                label_data['color'] = label['color']
+                label_data['description'] = label.get('description', '')
+
                 try:
-                    create_response = requests.post(gitea_api_url, headers=gitea_headers, json=label_data)
+                    create_response = http.post(gitea_api_url, headers=gitea_write_headers, data=http.dumps_bytes(label_data))
                     create_response.raise_for_status()
-                    created_count += 1
-                    logger.debug(f"Created label in Gitea: {label['name']}")
+                    logger.debug("Created label in Gitea: %s", label['name'])
+                    return 'created'
                 except Exception as e:
-                    logger.error(f"Error creating label in Gitea: {e}")
+                    logger.error("Error creating label in Gitea: %s", e)
+                    return 'skipped'
+
+        # Each label is an independent Gitea request, so fan them out
+        # instead of paying one round-trip per label sequentially
+        with ThreadPoolExecutor(max_workers=MAX_METADATA_WORKERS) as executor:
+            for outcome in executor.map(upsert_label, github_labels):
+                if outcome == 'created':
+                    created_count += 1
+                elif outcome == 'updated':
+                    updated_count += 1
+                elif outcome == 'unchanged':
+                    unchanged_count += 1
+                else:
                     skipped_count += 1
-        
-        logger.info(f"Labels mirroring summary: {created_count} created, {updated_count} updated, {skipped_count} skipped")
+
+        logger.info(f"Labels mirroring summary: {created_count} created, {updated_count} updated, {unchanged_count} unchanged, {skipped_count} skipped")
         return True
         
     except requests.exceptions.RequestException as e:
@@ -97,11 +193,12 @@ def mirror_github_milestones(gitea_token, gitea_url, gitea_owner, gitea_repo, gi
     if github_token:
         github_headers['Authorization'] = f'token {github_token}'
     
-    # Gitea API headers
+    # Gitea API headers; Content-Type only matters on requests with a
+    # body, so the read form stays minimal
     gitea_headers = {
         'Authorization': f'token {gitea_token}',
-        'Content-Type': 'application/json',
     }
+    gitea_write_headers = {**gitea_headers, 'Content-Type': 'application/json'}
     
     # Get milestones from GitHub
     github_api_url = f"https://api.github.com/repos/{github_repo}/milestones"
@@ -111,84 +208,90 @@ def mirror_github_milestones(gitea_token, gitea_url, gitea_owner, gitea_repo, gi
     }
     
     try:
-        # Paginate through all milestones
-        page = 1
-        all_milestones = []
-        
-        while True:
-            params['page'] = page
-            response = requests.get(github_api_url, headers=github_headers, params=params)
-            response.raise_for_status()
-            
-            milestones = response.json()
-            if not milestones:
-                break  # No more milestones
-                
-            all_milestones.extend(milestones)
-            
-            # Check if there are more pages
-            if len(milestones) < params['per_page']:
-                break
-                
-            page += 1
-        
+        # Paginate by the Link header via the shared helper, which also
+        # revalidates unchanged pages through the ETag cache and avoids
+        # the wasted empty-page request when the last page is exactly full
+        all_milestones = _cached_github_list(
+            (github_repo, 'milestones'),
+            lambda: http.fetch_all_pages(github_api_url, github_headers, params),
+        )
         logger.info(f"Found {len(all_milestones)} milestones in GitHub repository {github_repo}")
         
         # Get existing milestones in Gitea
         gitea_api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/milestones"
-        gitea_milestones_response = requests.get(gitea_api_url, headers=gitea_headers, params={'state': 'all'})
-        gitea_milestones_response.raise_for_status()
-        
-        gitea_milestones = gitea_milestones_response.json()
+        gitea_milestones, _ = http.get_json_cached(gitea_api_url, headers=gitea_headers, params={'state': 'all'})
         existing_milestones = {milestone['title']: milestone for milestone in gitea_milestones}
+
+        # Per-item URL base, built once outside the loop
+        update_base = gitea_api_url + '/'
         
         # Mirror milestones
         created_count = 0
         updated_count = 0
+        unchanged_count = 0
         skipped_count = 0
-        
-        for milestone in all_milestones:
+
+        def upsert_milestone(milestone):
             # Check if milestone already exists in Gitea
             if milestone['title'] in existing_milestones:
-                # Update existing milestone
                 gitea_milestone = existing_milestones[milestone['title']]
-                update_url = f"{gitea_api_url}/{gitea_milestone['id']}"
-                
+
+                # Skip the PATCH when the Gitea milestone already matches
+                if (gitea_milestone.get('state') == milestone['state']
+                        and (gitea_milestone.get('description') or '') == (milestone.get('description') or '')
+                        and _normalize_due_on(gitea_milestone.get('due_on')) == _normalize_due_on(milestone.get('due_on'))):
+                    logger.debug("Milestone unchanged in Gitea: %s", milestone['title'])
+                    return 'unchanged'
+
+                # Update existing milestone
+                update_url = update_base + str(gitea_milestone['id'])
+
                 # Prepare milestone data
-                milestone_data = {
-                    'title': milestone['title'],
-                    'description': milestone.get('description', ''),
-                    'state': milestone['state'],
-                    'due_on': milestone.get('due_on', None),
-                }
-                
+                milestone_data = _MILESTONE_TEMPLATE.copy()
+                milestone_data['title'] = milestone['title']
+                milestone_data['description'] = milestone.get('description', '')
+                milestone_data['state'] = milestone['state']
+                milestone_data['due_on'] = milestone.get('due_on', None)
+
                 try:
-                    update_response = requests.patch(update_url, headers=gitea_headers, json=milestone_data)
+                    update_response = http.patch(update_url, headers=gitea_write_headers, data=http.dumps_bytes(milestone_data))
                     update_response.raise_for_status()
-                    updated_count += 1
-                    logger.debug(f"Updated milestone in Gitea: {milestone['title']}")
+                    logger.debug("Updated milestone in Gitea: %s", milestone['title'])
+                    return 'updated'
                 except Exception as e:
-                    logger.error(f"Error updating milestone in Gitea: {e}")
-                    skipped_count += 1
+                    logger.error("Error updating milestone in Gitea: %s", e)
+                    return 'skipped'
             else:
                 # Create new milestone
-                milestone_data = {
-                    'title': milestone['title'],
-                    'description': milestone.get('description', ''),
-                    'state': milestone['state'],
-                    'due_on': milestone.get('due_on', None),
-                }
-                
+                milestone_data = _MILESTONE_TEMPLATE.copy()
+                milestone_data['title'] = milestone['title']
+                milestone_data['description'] = milestone.get('description', '')
+                milestone_data['state'] = milestone['state']
+                milestone_data['due_on'] = milestone.get('due_on', None)
+
                 try:
-                    create_response = requests.post(gitea_api_url, headers=gitea_headers, json=milestone_data)
+                    create_response = http.post(gitea_api_url, headers=gitea_write_headers, data=http.dumps_bytes(milestone_data))
                     create_response.raise_for_status()
-                    created_count += 1
-                    logger.debug(f"Created milestone in Gitea: {milestone['title']}")
+                    logger.debug("Created milestone in Gitea: %s", milestone['title'])
+                    return 'created'
                 except Exception as e:
-                    logger.error(f"Error creating milestone in Gitea: {e}")
+                    logger.error("Error creating milestone in Gitea: %s", e)
+                    return 'skipped'
+
+        # Milestones are independent of each other, so mirror them with
+        # several requests in flight
+        with ThreadPoolExecutor(max_workers=MAX_METADATA_WORKERS) as executor:
+            for outcome in executor.map(upsert_milestone, all_milestones):
+                if outcome == 'created':
+                    created_count += 1
+                elif outcome == 'updated':
+                    updated_count += 1
+                elif outcome == 'unchanged':
+                    unchanged_count += 1
+                else:
                     skipped_count += 1
-        
-        logger.info(f"Milestones mirroring summary: {created_count} created, {updated_count} updated, {skipped_count} skipped")
+
+        logger.info(f"Milestones mirroring summary: {created_count} created, {updated_count} updated, {unchanged_count} unchanged, {skipped_count} skipped")
         return True
         
     except requests.exceptions.RequestException as e:
@@ -199,78 +302,91 @@ def delete_all_issues_and_prs(gitea_token, gitea_url, gitea_owner, gitea_repo):
     """Delete all issues and PRs for a repository in Gitea"""
     logger.info(f"Deleting all issues and PRs for repository {gitea_owner}/{gitea_repo}")
     
-    # Gitea API headers
+    # Gitea API headers; Content-Type only matters on requests with a
+    # body, so the read form stays minimal
     gitea_headers = {
         'Authorization': f'token {gitea_token}',
-        'Content-Type': 'application/json',
     }
+    gitea_write_headers = {**gitea_headers, 'Content-Type': 'application/json'}
     
     # Get all issues in Gitea (including PRs which are represented as issues)
     gitea_api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/issues"
     
     try:
-        # Get all issues with pagination
-        gitea_issues = []
-        gitea_page = 1
-        
-        while True:
-            gitea_issues_response = requests.get(
-                gitea_api_url, 
-                headers=gitea_headers, 
-                params={'state': 'all', 'page': gitea_page, 'limit': 50}
-            )
-            gitea_issues_response.raise_for_status()
-            
-            page_issues = gitea_issues_response.json()
-            if not page_issues:
-                break  # No more issues
-                
-            gitea_issues.extend(page_issues)
-            
-            # Check if there are more pages
-            if len(page_issues) < 50:
-                break
-                
-            gitea_page += 1
-        
+        # Get all issues, following the Link header and asking for the
+        # largest page size the server allows
+        gitea_limit = http.get_gitea_page_limit(gitea_url, gitea_headers)
+        gitea_issues = http.fetch_all_pages(gitea_api_url, gitea_headers, {'state': 'all', 'limit': gitea_limit})
+
         logger.info(f"Found {len(gitea_issues)} issues/PRs to delete in Gitea repository {gitea_owner}/{gitea_repo}")
         
         # Delete each issue
         deleted_count = 0
         failed_count = 0
-        
-        for issue in gitea_issues:
+
+        # The endpoint base is already in gitea_api_url; append only the
+        # number instead of re-interpolating the whole URL per issue
+        delete_base = gitea_api_url + '/'
+
+        # Gitea only lets admins delete issues; for other tokens every
+        # DELETE is a wasted round-trip before the close fallback. One
+        # probe against a nonexistent issue settles it: 403 means the
+        # token may not delete, anything else (404 for admins) means the
+        # DELETE path is worth trying.
+        can_delete = True
+        if gitea_issues:
+            probe = http.delete(delete_base + '0', headers=gitea_headers)
+            can_delete = probe.status_code != 403
+            if not can_delete:
+                logger.info(f"Token cannot delete issues in {gitea_owner}/{gitea_repo}, closing them instead")
+
+        def delete_issue(issue):
             issue_number = issue['number']
-            delete_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/issues/{issue_number}"
-            
+            delete_url = delete_base + str(issue_number)
+
+            # Branch on status codes rather than raise_for_status so the
+            # common fallback path costs no exception machinery; only
+            # transport failures raise, caught once below
             try:
-                # Use the standard Gitea API to delete the issue
-                delete_response = requests.delete(delete_url, headers=gitea_headers)
-                
-                if delete_response.status_code in [200, 204]:
-                    logger.debug(f"Successfully deleted issue/PR #{issue_number}")
+                if can_delete:
+                    # Use the standard Gitea API to delete the issue
+                    delete_response = http.delete(delete_url, headers=gitea_headers)
+
+                    if delete_response.status_code in [200, 204]:
+                        logger.debug("Successfully deleted issue/PR #%s", issue_number)
+                        return True
+
+                    # If direct deletion fails, try closing the issue as a fallback
+                    logger.warning("Could not delete issue/PR #%s (status code: %s), attempting to close it instead", issue_number, delete_response.status_code)
+
+                # Close the issue with a note
+                close_data = {
+                    'state': 'closed',
+                    'body': issue.get('body', '') + '\n\n*This issue was automatically closed during repository cleanup.*'
+                }
+
+                close_response = http.patch(delete_url, headers=gitea_write_headers, data=http.dumps_bytes(close_data))
+                if close_response.status_code in [200, 201, 204]:
+                    logger.warning("Issue/PR #%s was closed but could not be deleted", issue_number)
+                    return True  # Count as deleted since it was at least closed
+
+                logger.error("Failed to close issue/PR #%s (status code: %s)", issue_number, close_response.status_code)
+                return False
+            except requests.RequestException as e:
+                logger.error("Error deleting issue/PR #%s: %s", issue_number, e)
+                return False
+
+        # Gitea exposes no bulk delete/close endpoint, so each issue costs
+        # one request; the pool keeps MAX_DELETE_WORKERS of them in flight
+        # over pooled connections, which amortizes the per-request
+        # overhead the way a batched call would
+        with ThreadPoolExecutor(max_workers=MAX_DELETE_WORKERS) as executor:
+            for deleted in executor.map(delete_issue, gitea_issues):
+                if deleted:
                     deleted_count += 1
                 else:
-                    # If direct deletion fails, try closing the issue as a fallback
-                    logger.warning(f"Could not delete issue/PR #{issue_number} (status code: {delete_response.status_code}), attempting to close it instead")
-                    
-                    # Close the issue with a note
-                    close_data = {
-                        'state': 'closed',
-                        'body': issue.get('body', '') + '\n\n*This issue was automatically closed during repository cleanup.*'
-                    }
-                    
-                    close_response = requests.patch(delete_url, headers=gitea_headers, json=close_data)
-                    if close_response.status_code in [200, 201, 204]:
-                        logger.warning(f"Issue/PR #{issue_number} was closed but could not be deleted")
-                        deleted_count += 1  # Count as deleted since it was at least closed
-                    else:
-                        logger.error(f"Failed to close issue/PR #{issue_number} (status code: {close_response.status_code})")
-                        failed_count += 1
-            except Exception as e:
-                logger.error(f"Error deleting issue/PR #{issue_number}: {e}")
-                failed_count += 1
-        
+                    failed_count += 1
+
         logger.info(f"Issues/PRs deletion summary: {deleted_count} deleted/closed, {failed_count} failed")
         return True, deleted_count, failed_count
         
@@ -284,7 +400,7 @@ def mirror_github_metadata(gitea_token, gitea_url, gitea_owner, gitea_repo, gith
     
     # If no config provided, get the default config
     if repo_config is None:
-        repo_config = get_repo_config(github_repo, gitea_owner, gitea_repo)
+        repo_config = _cached_repo_config(github_repo, gitea_owner, gitea_repo)
     
     # Check if metadata mirroring is enabled
     if not repo_config.get('mirror_metadata', False):
@@ -311,87 +427,52 @@ def mirror_github_metadata(gitea_token, gitea_url, gitea_owner, gitea_repo, gith
     }
     
     has_errors = False
-    
-    # Mirror labels first (needed for issues and PRs)
-    if repo_config.get('mirror_labels', False):
-        try:
-            labels_result = mirror_github_labels(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, github_token)
-            if not labels_result:
-                logger.warning("Labels mirroring failed or had issues")
-                components_status['labels']['success'] = False
-                components_status['labels']['message'] = "Labels mirroring failed"
-        except Exception as e:
-            logger.error(f"Error mirroring labels: {e}")
-            components_status['labels']['success'] = False
-            components_status['labels']['message'] = f"Error: {str(e)}"
-            has_errors = True
-    else:
-        logger.info(f"Labels mirroring is disabled for {github_repo} -> {gitea_owner}/{gitea_repo}")
-    
-    # Mirror milestones (needed for issues and PRs)
-    if repo_config.get('mirror_milestones', False):
-        try:
-            milestones_result = mirror_github_milestones(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, github_token)
-            if not milestones_result:
-                logger.warning("Milestones mirroring failed or had issues")
-                components_status['milestones']['success'] = False
-                components_status['milestones']['message'] = "Milestones mirroring failed"
-        except Exception as e:
-            logger.error(f"Error mirroring milestones: {e}")
-            components_status['milestones']['success'] = False
-            components_status['milestones']['message'] = f"Error: {str(e)}"
-            has_errors = True
-    else:
-        logger.info(f"Milestones mirroring is disabled for {github_repo} -> {gitea_owner}/{gitea_repo}")
-    
-    # Mirror issues
-    if repo_config.get('mirror_issues', False):
-        try:
-            issues_result = mirror_github_issues(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, github_token)
-            if not issues_result:
-                logger.warning("Issues mirroring failed or had issues")
-                components_status['issues']['success'] = False
-                components_status['issues']['message'] = "Issues mirroring failed"
-        except Exception as e:
-            logger.error(f"Error mirroring issues: {e}")
-            components_status['issues']['success'] = False
-            components_status['issues']['message'] = f"Error: {str(e)}"
-            has_errors = True
-    else:
-        logger.info(f"Issues mirroring is disabled for {github_repo} -> {gitea_owner}/{gitea_repo}")
-    
-    # Mirror PRs
-    if repo_config.get('mirror_pull_requests', False):
-        try:
-            prs_result = mirror_github_prs(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, github_token)
-            if not prs_result:
-                logger.warning("Pull requests mirroring failed or had issues")
-                components_status['prs']['success'] = False
-                components_status['prs']['message'] = "Pull requests mirroring failed"
-        except Exception as e:
-            logger.error(f"Error mirroring pull requests: {e}")
-            components_status['prs']['success'] = False
-            components_status['prs']['message'] = f"Error: {str(e)}"
-            has_errors = True
-    else:
-        logger.info(f"Pull requests mirroring is disabled for {github_repo} -> {gitea_owner}/{gitea_repo}")
-    
-    # Mirror wiki
-    if repo_config.get('mirror_wiki', False):
+
+    def run_component(component, display, mirror_func):
+        nonlocal has_errors
         try:
-            wiki_result = mirror_github_wiki(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, github_token)
-            if not wiki_result:
-                logger.warning("Wiki mirroring failed or had issues")
-                components_status['wiki']['success'] = False
-                components_status['wiki']['message'] = "Wiki mirroring failed"
+            result = mirror_func(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, github_token)
+            if not result:
+                logger.warning(f"{display} mirroring failed or had issues")
+                components_status[component]['success'] = False
+                components_status[component]['message'] = f"{display} mirroring failed"
         except Exception as e:
-            logger.error(f"Error mirroring wiki: {e}")
-            components_status['wiki']['success'] = False
-            components_status['wiki']['message'] = f"Error: {str(e)}"
+            logger.error(f"Error mirroring {display.lower()}: {e}")
+            components_status[component]['success'] = False
+            components_status[component]['message'] = f"Error: {str(e)}"
             has_errors = True
-    else:
-        logger.info(f"Wiki mirroring is disabled for {github_repo} -> {gitea_owner}/{gitea_repo}")
-    
+
+    # The components only depend on each other across phases: issues and
+    # PRs need labels and milestones in place first, but labels,
+    # milestones and the wiki are mutually independent, as are issues and
+    # PRs. Running each phase's components concurrently overlaps their
+    # network time instead of paying for them back to back.
+    phases = [
+        [
+            ('mirror_labels', 'labels', 'Labels', mirror_github_labels),
+            ('mirror_milestones', 'milestones', 'Milestones', mirror_github_milestones),
+            ('mirror_wiki', 'wiki', 'Wiki', mirror_github_wiki),
+        ],
+        [
+            ('mirror_issues', 'issues', 'Issues', mirror_github_issues),
+            ('mirror_pull_requests', 'prs', 'Pull requests', mirror_github_prs),
+        ],
+    ]
+
+    for phase in phases:
+        enabled = []
+        for config_key, component, display, mirror_func in phase:
+            if repo_config.get(config_key, False):
+                enabled.append((component, display, mirror_func))
+            else:
+                logger.info(f"{display} mirroring is disabled for {github_repo} -> {gitea_owner}/{gitea_repo}")
+
+        if enabled:
+            with ThreadPoolExecutor(max_workers=len(enabled)) as executor:
+                futures = [executor.submit(run_component, *entry) for entry in enabled]
+                for future in futures:
+                    future.result()
+
     # Return overall success status
     overall_success = all(component['success'] for component in components_status.values())
     
@@ -1,9 +1,192 @@
 import logging
+import re
+import threading
 import requests
-from .comment import mirror_github_issue_comments
+from concurrent.futures import ThreadPoolExecutor
+from ..utils import http
+from .comment import (
+    forget_gitea_issue_comments,
+    get_gitea_issue_comments,
+    mirror_github_issue_comments,
+    prefill_gitea_comment_cache,
+)
 
 logger = logging.getLogger('github-gitea-mirror')
 
+# Markers left in mirrored issue bodies and titles, compiled once so the
+# existing-issue scan is a single regex search per field instead of a
+# line-by-line split chain. The body pattern accepts both marker styles
+# and the optional [#123](url) link form.
+_BODY_PR_RE = re.compile(r'(?:Mirrored from GitHub Pull Request|\*\*Original PR:)\s*\[?#(\d+)')
+_TITLE_PR_RE = re.compile(r'\[GH-PR-(\d+)\]')
+
+# Markers embedding the GitHub review or review-comment id in every
+# mirrored body; dedup keys on these ids, which are stable across edits
+# and unique even for near-identical comments
+_GH_REVIEW_ID_RE = re.compile(r'<!-- gh-review-id:(\d+) -->')
+_GH_REVIEW_COMMENT_ID_RE = re.compile(r'<!-- gh-review-comment-id:(\d+) -->')
+
+# Bare '>' quote lines fixed in one multiline pass instead of a
+# split/loop/join over every body (same pattern comment.py uses)
+_QUOTE_FIX_RE = re.compile(r'(?m)^>(?! )(?=.)')
+
+# Bound the number of concurrent per-PR detail fetches against GitHub.
+# A GraphQL batch query could return many PRs with their commits and
+# files in one round-trip, but it has its own rate budget and response
+# shape, and it cannot use the ETag revalidation that makes repeat syncs
+# here nearly free; concurrent REST fetches keep one code path and get
+# most of the same wall-time win.
+MAX_PR_FETCH_WORKERS = 8
+
+# Bound the number of concurrent issue writes against Gitea
+MAX_GITEA_WRITE_WORKERS = 8
+
+# At most this many file diffs are rendered into a PR body; patch text
+# past this point is dropped right after fetching
+MAX_RENDERED_DIFFS = 5
+
+# Formatted title/body payloads for finished PRs, keyed by PR id with
+# the update time stored alongside. Closed and merged PRs never change,
+# so re-syncs reuse the built payload and skip their commits/files
+# fetches entirely; keying by id alone means an entry for a PR that was
+# updated replaces the stale one instead of leaking next to it for the
+# life of the scheduler.
+_PAYLOAD_CACHE = {}
+
+
+def _cached_payload(pr):
+    """Return the cached (title, body) for a PR if it is still current"""
+    cached = _PAYLOAD_CACHE.get(pr.get('id'))
+    if cached is not None and cached[0] == pr.get('updated_at'):
+        return cached[1]
+    return None
+
+
+def _store_payload(pr, payload):
+    if pr.get('id') is not None and pr.get('updated_at') is not None:
+        _PAYLOAD_CACHE[pr['id']] = (pr['updated_at'], payload)
+
+
+def _pr_is_finished(pr):
+    return pr.get('merged', False) or pr['state'] == 'closed'
+
+
+def _format_pr_title(pr):
+    """Format the Gitea issue title for a GitHub pull request
+
+    The title encodes the PR number and its merged/closed state, which
+    makes it a cheap change detector: a mirrored issue whose title
+    already matches a finished PR cannot need an update.
+    """
+    status_indicator = ""
+    if pr.get('merged', False):
+        status_indicator = "[MERGED] "
+    elif pr['state'] == 'closed':
+        status_indicator = "[CLOSED] "
+
+    return f"[GH-PR-{pr['number']}] {status_indicator}{pr['title']}"
+
+
+def _build_pr_payload(pr, commits, files, commit_total=None):
+    """Format the Gitea issue title and body for a GitHub pull request
+
+    commits may hold only the first page of a very large PR, in which
+    case commit_total carries the real count for the headline and the
+    "more commits" note; only the first 10 commits are ever rendered.
+    """
+    pr_title = _format_pr_title(pr)
+    
+    # Collect the body in a list and join once at the end; building it
+    # with += reallocates the whole string for every piece, which turns
+    # quadratic on PRs carrying large diff hunks
+    parts = []
+
+    # Create a prominent link at the top of the issue body
+    parts.append(f"*Mirrored from GitHub Pull Request [#{pr['number']}]({pr['html_url']})*\n\n")
+    parts.append(f"**Original author: @{pr['user']['login']}**\n\n")
+    parts.append(f"**Created at: {pr['created_at']}**\n\n")
+    
+    # Add PR status information
+    parts.append(f"**Status: {pr['state'].upper()}**\n\n")
+    if pr.get('merged', False):
+        parts.append(f"**Merged: YES (at {pr.get('merged_at', 'unknown time')})**\n\n")
+        # Add merge commit information if available
+        if pr.get('merge_commit_sha'):
+            parts.append(f"**Merge commit: [{pr['merge_commit_sha'][:7]}]({pr.get('html_url', '')}/commits/{pr['merge_commit_sha']})**\n\n")
+    elif pr['state'] == 'closed':
+        parts.append(f"**Merged: NO (closed at {pr.get('closed_at', 'unknown time')})**\n\n")
+    
+    # Add branch information
+    parts.append(f"**Source branch: {pr['head']['label']}**\n\n")
+    parts.append(f"**Target branch: {pr['base']['label']}**\n\n")
+    
+    # Add commit information, prefetched above
+    if commits:
+        if commit_total is None:
+            commit_total = len(commits)
+        logger.info(f"Found {commit_total} commits for PR #{pr['number']}")
+        parts.append(f"## Commits ({commit_total})\n\n")
+        for commit in commits[:10]:  # Limit to 10 commits to avoid huge bodies
+            commit_sha = commit.get('sha', '')[:7]
+            commit_message = commit.get('commit', {}).get('message', '').split('\n')[0]  # First line only
+            commit_author = commit.get('commit', {}).get('author', {}).get('name', 'Unknown')
+            commit_link = f"{pr.get('html_url', '')}/commits/{commit.get('sha', '')}"
+            parts.append(f"* [`{commit_sha}`]({commit_link}) {commit_message} - {commit_author}\n")
+
+        if commit_total > 10:
+            parts.append(f"\n*... and {commit_total - 10} more commits*\n")
+
+        parts.append("\n")
+    else:
+        logger.warning(f"No commits found for PR #{pr['number']} - API returned empty list")
+
+    # Add PR description
+    if pr['body']:
+        parts.append(f"## Description\n\n{pr['body']}\n\n")
+    
+    # Add file changes summary, prefetched above
+    if files:
+        logger.info(f"Found {len(files)} changed files for PR #{pr['number']}")
+        additions = sum(file.get('additions', 0) for file in files)
+        deletions = sum(file.get('deletions', 0) for file in files)
+        parts.append(f"## Changes\n\n")
+        parts.append(f"**Files changed:** {len(files)}\n")
+        parts.append(f"**Lines added:** +{additions}\n")
+        parts.append(f"**Lines removed:** -{deletions}\n\n")
+
+        parts.append("**Modified files:**\n")
+        for file in files[:15]:  # Limit to 15 files to avoid huge bodies
+            filename = file.get('filename', '')
+            status = file.get('status', '')
+            parts.append(f"* {status}: `{filename}` (+{file.get('additions', 0)}/-{file.get('deletions', 0)})\n")
+
+        if len(files) > 15:
+            parts.append(f"\n*... and {len(files) - 15} more files*\n\n")
+        else:
+            parts.append("\n")
+
+        # Add diff information for up to 5 files
+        diff_count = 0
+        for file in files:
+            if diff_count >= MAX_RENDERED_DIFFS:
+                break
+
+            if file.get('patch'):
+                filename = file.get('filename', '')
+                parts.append(f"**Diff for `{filename}`:**\n")
+                parts.append("```diff\n")
+                parts.append(file.get('patch', ''))
+                parts.append("\n```\n\n")
+                diff_count += 1
+
+        if diff_count < len(files):
+            parts.append(f"*Diffs for {len(files) - diff_count} more files are not shown*\n\n")
+    else:
+        logger.warning(f"No file changes found for PR #{pr['number']} - API returned empty list")
+
+    return pr_title, ''.join(parts)
+
+
 def mirror_github_prs(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, github_token=None):
     """Mirror pull requests from GitHub to Gitea as issues (since we can't create PRs directly)"""
     logger.info(f"Mirroring pull requests from GitHub repository {github_repo} to Gitea repository {gitea_owner}/{gitea_repo}")
@@ -19,34 +202,19 @@ def mirror_github_prs(gitea_token, gitea_url, gitea_owner, gitea_repo, github_re
         'Content-Type': 'application/json',
     }
     
-    # Get pull requests from GitHub
+    # Get pull requests from GitHub; the per-PR commits and files URLs
+    # below reuse this base instead of re-formatting the full repo path
     github_api_url = f"https://api.github.com/repos/{github_repo}/pulls"
     params = {
         'state': 'all',  # Get both open and closed PRs
         'per_page': 100,  # Maximum allowed by GitHub API
     }
     
-    all_prs = []
     try:
-        # Paginate through all PRs
-        page = 1
-        
-        while True:
-            params['page'] = page
-            response = requests.get(github_api_url, headers=github_headers, params=params)
-            response.raise_for_status()
-            
-            prs = response.json()
-            if not prs:
-                break  # No more PRs
-                
-            all_prs.extend(prs)
-            
-            # Check if there are more pages
-            if len(prs) < params['per_page']:
-                break
-                
-            page += 1
+        # The first page's Link header tells us how many pages exist; the
+        # shared helper fetches the rest concurrently instead of walking
+        # them one round-trip at a time
+        all_prs = http.fetch_all_pages(github_api_url, github_headers, params)
     except requests.exceptions.RequestException as e:
         logger.error(f"Error getting pull requests: {e}")
         return False
@@ -61,10 +229,10 @@ def mirror_github_prs(gitea_token, gitea_url, gitea_owner, gitea_repo, github_re
     # Create issues in Gitea for PRs
     gitea_api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/issues"
     
-    # Get existing issues in Gitea to avoid duplicates
-    existing_issues = {}
-    existing_titles = {}
-    existing_gh_numbers = set()  # Track GitHub PR numbers we've already processed
+    # GitHub PR number -> Gitea issue number for every PR already
+    # mirrored; one dict serves as both the duplicate check and the
+    # issue-number lookup
+    mirrored_issues = {}
     
     try:
         # Get all issues with pagination
@@ -72,14 +240,14 @@ def mirror_github_prs(gitea_token, gitea_url, gitea_owner, gitea_repo, github_re
         gitea_page = 1
         
         while True:
-            gitea_issues_response = requests.get(
+            gitea_issues_response = http.get(
                 gitea_api_url, 
                 headers=gitea_headers, 
                 params={'state': 'all', 'page': gitea_page, 'limit': 50}
             )
             gitea_issues_response.raise_for_status()
             
-            page_issues = gitea_issues_response.json()
+            page_issues = http.decode_json(gitea_issues_response)
             if not page_issues:
                 break  # No more issues
                 
@@ -96,63 +264,18 @@ def mirror_github_prs(gitea_token, gitea_url, gitea_owner, gitea_repo, github_re
         # Create a mapping of GitHub PR numbers to Gitea issue numbers
         for issue in gitea_issues:
             # Look for the GitHub PR number in the body
-            github_pr_num = None
-            
             if issue['body']:
-                # Try to extract GitHub PR number from the body
-                body_lines = issue['body'].split('\n')
-                for line in body_lines:
-                    if '*Mirrored from GitHub Pull Request' in line or '**Original PR:' in line:
-                        try:
-                            # Extract the GitHub PR number - handle both formats
-                            # *Mirrored from GitHub Pull Request #123*
-                            # *Mirrored from GitHub Pull Request [#123](url)*
-                            if '#' in line:
-                                # Extract number after # and before closing * or ]
-                                num_text = line.split('#')[1]
-                                if ']' in num_text:
-                                    github_pr_num = int(num_text.split(']')[0])
-                                elif '*' in num_text:
-                                    github_pr_num = int(num_text.split('*')[0])
-                                else:
-                                    github_pr_num = int(num_text.strip())
-                                
-                                if github_pr_num:
-                                    existing_issues[github_pr_num] = issue['number']
-                                    existing_gh_numbers.add(github_pr_num)
-                                    break
-                        except (ValueError, IndexError) as e:
-                            logger.warning(f"Failed to extract GitHub PR number from body: {e}")
-            
-            # Also check title for [GH-PR-123] format
-            if issue['title'] and '[GH-PR-' in issue['title']:
-                try:
-                    title_parts = issue['title'].split('[GH-PR-')
-                    if len(title_parts) > 1:
-                        num_part = title_parts[1].split(']')[0]
-                        gh_num = int(num_part)
-                        existing_issues[gh_num] = issue['number']
-                        existing_gh_numbers.add(gh_num)
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Failed to extract GitHub PR number from title: {e}")
-            
-            # Also check for [GH-PR-31] format (without the PR- prefix in the split)
-            elif issue['title'] and '[GH-' in issue['title']:
-                try:
-                    title_parts = issue['title'].split('[GH-')
-                    if len(title_parts) > 1:
-                        num_part = title_parts[1].split(']')[0]
-                        # Check if this is a PR reference
-                        if num_part.startswith('PR-'):
-                            # Extract the number after 'PR-'
-                            pr_num = int(num_part.split('PR-')[1])
-                            existing_issues[pr_num] = issue['number']
-                            existing_gh_numbers.add(pr_num)
-                except (ValueError, IndexError) as e:
-                    logger.warning(f"Failed to extract GitHub PR number from title: {e}")
-            
-            # Store title mapping as fallback
-            existing_titles[issue['title']] = issue['number']
+                body_match = _BODY_PR_RE.search(issue['body'])
+                if body_match:
+                    github_pr_num = int(body_match.group(1))
+                    mirrored_issues[github_pr_num] = issue['number']
+
+            # Also check the title for the [GH-PR-123] marker
+            if issue['title']:
+                title_match = _TITLE_PR_RE.search(issue['title'])
+                if title_match:
+                    gh_num = int(title_match.group(1))
+                    mirrored_issues[gh_num] = issue['number']
     except Exception as e:
         logger.warning(f"Error getting existing issues from Gitea: {e}")
     
@@ -160,240 +283,159 @@ def mirror_github_prs(gitea_token, gitea_url, gitea_owner, gitea_repo, github_re
     created_count = 0
     updated_count = 0
     skipped_count = 0
-    
-    for pr in all_prs:
+
+    def fetch_pr_details(pr):
+        """Fetch the commits and changed files for one PR"""
+        commits = []
+        files = []
+        commit_total = 0
+
+        # PRs mirrored in an earlier run are skipped wholesale by the
+        # write phase, and finished PRs keep their built payload cached;
+        # either way both fetches are pointless
+        if pr['number'] in mirrored_issues or _cached_payload(pr) is not None:
+            return pr, commits, files, commit_total
+
+        # Both endpoints default to 30 items per page; request the
+        # 100-item maximum. Pages revalidate via ETag and are served
+        # from the cache on a 304.
         try:
-            # Format the title with GitHub PR number and status
-            status_indicator = ""
-            if pr.get('merged', False):
-                status_indicator = "[MERGED] "
-            elif pr['state'] == 'closed':
-                status_indicator = "[CLOSED] "
-            
-            pr_title = f"[GH-PR-{pr['number']}] {status_indicator}{pr['title']}"
-            
-            # Create a prominent link at the top of the issue body
-            pr_body = f"*Mirrored from GitHub Pull Request [#{pr['number']}]({pr['html_url']})*\n\n"
-            pr_body += f"**Original author: @{pr['user']['login']}**\n\n"
-            pr_body += f"**Created at: {pr['created_at']}**\n\n"
-            
-            # Add PR status information
-            pr_body += f"**Status: {pr['state'].upper()}**\n\n"
-            if pr.get('merged', False):
-                pr_body += f"**Merged: YES (at {pr.get('merged_at', 'unknown time')})**\n\n"
-                # Add merge commit information if available
-                if pr.get('merge_commit_sha'):
-                    pr_body += f"**Merge commit: [{pr['merge_commit_sha'][:7]}]({pr.get('html_url', '')}/commits/{pr['merge_commit_sha']})**\n\n"
-            elif pr['state'] == 'closed':
-                pr_body += f"**Merged: NO (closed at {pr.get('closed_at', 'unknown time')})**\n\n"
-            
-            # Add branch information
-            pr_body += f"**Source branch: {pr['head']['label']}**\n\n"
-            pr_body += f"**Target branch: {pr['base']['label']}**\n\n"
-            
-            # Add commit information
-            try:
-                # Get commits for this PR
-                commits_url = f"https://api.github.com/repos/{github_repo}/pulls/{pr['number']}/commits"
-                logger.info(f"Fetching commits for PR #{pr['number']} from {commits_url}")
-                commits_response = requests.get(commits_url, headers=github_headers)
-                commits_response.raise_for_status()
-                commits = commits_response.json()
-                
-                if commits:
-                    logger.info(f"Found {len(commits)} commits for PR #{pr['number']}")
-                    pr_body += f"## Commits ({len(commits)})\n\n"
-                    for commit in commits[:10]:  # Limit to 10 commits to avoid huge bodies
-                        commit_sha = commit.get('sha', '')[:7]
-                        commit_message = commit.get('commit', {}).get('message', '').split('\n')[0]  # First line only
-                        commit_author = commit.get('commit', {}).get('author', {}).get('name', 'Unknown')
-                        commit_link = f"{pr.get('html_url', '')}/commits/{commit.get('sha', '')}"
-                        pr_body += f"* [`{commit_sha}`]({commit_link}) {commit_message} - {commit_author}\n"
-                    
-                    if len(commits) > 10:
-                        pr_body += f"\n*... and {len(commits) - 10} more commits*\n"
-                    
-                    pr_body += "\n"
-                else:
-                    logger.warning(f"No commits found for PR #{pr['number']} - API returned empty list")
-            except Exception as e:
-                logger.error(f"Error fetching commits for PR #{pr['number']}: {e}")
-            
-            # Add PR description
-            if pr['body']:
-                pr_body += f"## Description\n\n{pr['body']}\n\n"
-            
-            # Add file changes summary
-            try:
-                # Get file changes for this PR
-                files_url = f"https://api.github.com/repos/{github_repo}/pulls/{pr['number']}/files"
-                logger.info(f"Fetching file changes for PR #{pr['number']} from {files_url}")
-                files_response = requests.get(files_url, headers=github_headers)
-                files_response.raise_for_status()
-                files = files_response.json()
-                
-                if files:
-                    logger.info(f"Found {len(files)} changed files for PR #{pr['number']}")
-                    additions = sum(file.get('additions', 0) for file in files)
-                    deletions = sum(file.get('deletions', 0) for file in files)
-                    pr_body += f"## Changes\n\n"
-                    pr_body += f"**Files changed:** {len(files)}\n"
-                    pr_body += f"**Lines added:** +{additions}\n"
-                    pr_body += f"**Lines removed:** -{deletions}\n\n"
-                    
-                    pr_body += "**Modified files:**\n"
-                    for file in files[:15]:  # Limit to 15 files to avoid huge bodies
-                        filename = file.get('filename', '')
-                        status = file.get('status', '')
-                        pr_body += f"* {status}: `{filename}` (+{file.get('additions', 0)}/-{file.get('deletions', 0)})\n"
-                    
-                    if len(files) > 15:
-                        pr_body += f"\n*... and {len(files) - 15} more files*\n\n"
-                    else:
-                        pr_body += "\n"
-                    
-                    # Add diff information for up to 5 files
-                    diff_count = 0
-                    for file in files:
-                        if diff_count >= 5:
-                            break
-                        
-                        if file.get('patch'):
-                            filename = file.get('filename', '')
-                            pr_body += f"**Diff for `{filename}`:**\n"
-                            pr_body += "```diff\n"
-                            pr_body += file.get('patch', '')
-                            pr_body += "\n```\n\n"
-                            diff_count += 1
-                    
-                    if diff_count < len(files):
-                        pr_body += f"*Diffs for {len(files) - diff_count} more files are not shown*\n\n"
-                else:
-                    logger.warning(f"No file changes found for PR #{pr['number']} - API returned empty list")
-            except Exception as e:
-                logger.error(f"Error fetching file changes for PR #{pr['number']}: {e}")
-            
-            # Skip if we've already processed this GitHub PR number in this run
-            if pr['number'] in existing_gh_numbers:
+            commits_url = f"{github_api_url}/{pr['number']}/commits"
+            logger.info(f"Fetching commits for PR #{pr['number']} from {commits_url}")
+            # Only the first 10 commits are rendered plus a total count,
+            # so one 100-item page always holds everything we show; for
+            # PRs with more commits a single per_page=1 probe reads the
+            # exact count from its Link rel="last" page number instead
+            # of pulling every remaining page
+            commits, commits_response = http.get_json_cached(commits_url, headers=github_headers, params={'per_page': 100})
+            commit_total = len(commits)
+            if http.get_last_page_number(commits_response) > 1:
+                _, probe = http.get_json_cached(commits_url, headers=github_headers, params={'per_page': 1})
+                commit_total = max(commit_total, http.get_last_page_number(probe))
+        except Exception as e:
+            logger.error(f"Error fetching commits for PR #{pr['number']}: {e}")
+
+        try:
+            files_url = f"{github_api_url}/{pr['number']}/files"
+            logger.info(f"Fetching file changes for PR #{pr['number']} from {files_url}")
+            files = http.fetch_all_pages(files_url, github_headers, {'per_page': 100})
+            # Only the first few patches are ever rendered; drop the rest
+            # now so multi-MB diff text for large PRs never lingers in
+            # memory (or the ETag cache) past this point. Rebuilt bodies
+            # are identical because the renderer stops at the same limit.
+            rendered = 0
+            for file in files:
+                if file.get('patch'):
+                    rendered += 1
+                    if rendered > MAX_RENDERED_DIFFS:
+                        file.pop('patch', None)
+        except Exception as e:
+            logger.error(f"Error fetching file changes for PR #{pr['number']}: {e}")
+
+        return pr, commits, files, commit_total
+
+    # The commits and files fetches are two independent GitHub round-trips
+    # per PR; prefetch them across PRs with several in flight so the
+    # body-building loop below never waits on the network
+    detail_pool = ThreadPoolExecutor(max_workers=MAX_PR_FETCH_WORKERS)
+
+    # Build every title/body payload first, then run the Gitea writes
+    # concurrently: each PR's create-or-update plus its comment mirroring
+    # is independent of the others and purely latency-bound
+    jobs = []
+
+    for pr, commits, files, commit_total in detail_pool.map(fetch_pr_details, all_prs):
+        try:
+            # Skip PRs already processed before any payload is built; the
+            # write phase would drop them anyway
+            if pr['number'] in mirrored_issues:
                 logger.debug(f"Skipping already processed GitHub PR #{pr['number']}")
                 skipped_count += 1
                 continue
-            
-            # Check if issue already exists in Gitea by GitHub PR number
-            if pr['number'] in existing_issues:
-                # Update existing issue
-                gitea_issue_number = existing_issues[pr['number']]
-                update_url = f"{gitea_api_url}/{gitea_issue_number}"
-                
-                # Prepare issue data
-                issue_data = {
-                    'title': pr_title,
-                    'body': pr_body,
-                }
-                
-                # Handle state properly for Gitea API
-                if pr['state'] == 'closed':
-                    issue_data['closed'] = True
-                
-                try:
-                    # Don't use Sudo parameter as it's causing 404 errors when the user doesn't exist in Gitea
-                    update_response = requests.patch(update_url, headers=gitea_headers, json=issue_data)
-                    update_response.raise_for_status()
-                    updated_count += 1
-                    logger.debug(f"Updated PR as issue in Gitea: {pr_title} (state: {pr['state']})")
-                    
-                    # Mark as processed
-                    existing_gh_numbers.add(pr['number'])
-                    
-                    # Mirror comments for this PR
-                    mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, pr['number'], gitea_issue_number, github_token)
-                    
-                    # Mirror review comments for this PR
-                    mirror_github_pr_review_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, pr['number'], gitea_issue_number, github_token)
-                except Exception as e:
-                    logger.error(f"Error updating PR as issue in Gitea: {e}")
-                    skipped_count += 1
+
+            cached = _cached_payload(pr)
+            if cached is not None:
+                pr_title, pr_body = cached
             else:
-                # Look for an existing issue with the exact PR number marker in the title
-                pr_number_marker = f"[GH-PR-{pr['number']}]"
-                found_matching_issue = False
-                
-                for existing_title, gitea_num in existing_titles.items():
-                    if pr_number_marker in existing_title:
-                        # Found a title with the correct PR number, update it
-                        update_url = f"{gitea_api_url}/{gitea_num}"
-                        
-                        # Prepare issue data
-                        issue_data = {
-                            'title': pr_title,
-                            'body': pr_body,
-                        }
-                        
-                        # Handle state properly for Gitea API
-                        if pr['state'] == 'closed':
-                            issue_data['closed'] = True
-                        
-                        try:
-                            update_response = requests.patch(update_url, headers=gitea_headers, json=issue_data)
-                            update_response.raise_for_status()
-                            updated_count += 1
-                            logger.debug(f"Updated PR as issue in Gitea by title marker: {pr_title} (state: {pr['state']})")
-                            
-                            # Mark as processed and update our mappings
-                            existing_gh_numbers.add(pr['number'])
-                            existing_issues[pr['number']] = gitea_num
-                            
-                            # Mirror comments for this PR
-                            mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, pr['number'], gitea_num, github_token)
-                            
-                            # Mirror review comments for this PR
-                            mirror_github_pr_review_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, pr['number'], gitea_num, github_token)
-                            
-                            found_matching_issue = True
-                            break
-                        except Exception as e:
-                            logger.error(f"Error updating PR as issue in Gitea: {e}")
-                            # Don't increment skipped_count here, we'll try to create it instead
-                
-                if found_matching_issue:
-                    continue
-                
-                # Create new issue for PR
-                issue_data = {
-                    'title': pr_title,
-                    'body': pr_body,
-                }
-                
-                # Handle state properly for Gitea API
-                if pr['state'] == 'closed':
-                    issue_data['closed'] = True
-                
-                try:
-                    # Don't use Sudo parameter as it's causing 404 errors when the user doesn't exist in Gitea
-                    create_response = requests.post(gitea_api_url, headers=gitea_headers, json=issue_data)
-                    create_response.raise_for_status()
-                    
-                    # Add the newly created issue to our mapping to avoid duplicates in the same run
-                    new_issue = create_response.json()
-                    existing_issues[pr['number']] = new_issue['number']
-                    existing_titles[pr_title] = new_issue['number']
-                    existing_gh_numbers.add(pr['number'])
-                    
-                    created_count += 1
-                    logger.debug(f"Created PR as issue in Gitea: {pr_title} (state: {pr['state']})")
-                    
-                    # Mirror comments for this PR
-                    mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, pr['number'], new_issue['number'], github_token)
-                    
-                    # Mirror review comments for this PR
-                    mirror_github_pr_review_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, pr['number'], new_issue['number'], github_token)
-                except Exception as e:
-                    logger.error(f"Error creating PR as issue in Gitea: {e}")
-                    skipped_count += 1
+                pr_title, pr_body = _build_pr_payload(pr, commits, files, commit_total)
+                if _pr_is_finished(pr):
+                    _store_payload(pr, (pr_title, pr_body))
+
+            # Serialize the request body once here; the write worker
+            # sends the bytes as-is instead of re-encoding the (often
+            # large) body inside requests
+            issue_data = {
+                'title': pr_title,
+                'body': pr_body,
+            }
+
+            # Handle state properly for Gitea API
+            if pr['state'] == 'closed':
+                issue_data['closed'] = True
+
+            jobs.append((pr, pr_title, http.dumps_bytes(issue_data)))
         except Exception as e:
             logger.error(f"Error processing PR #{pr.get('number', 'unknown')}: {e}")
             skipped_count += 1
-    
+
+    detail_pool.shutdown()
+
+    # The mirrored-issues dict is shared across write workers; mutations
+    # are rare (one claim and one insert per PR), so a single lock
+    # suffices
+    state_lock = threading.Lock()
+
+    def write_pr(job):
+        """Create the Gitea issue for one PR and mirror its comments"""
+        pr, pr_title, payload = job
+
+        with state_lock:
+            # Skip if we've already processed this GitHub PR number in this run
+            if pr['number'] in mirrored_issues:
+                logger.debug(f"Skipping already processed GitHub PR #{pr['number']}")
+                return 'skipped'
+            # Claim the number so no other worker writes the same PR; the
+            # placeholder is replaced with the real issue number on success
+            mirrored_issues[pr['number']] = None
+
+        # Create new issue for PR
+        try:
+            # Don't use Sudo parameter as it's causing 404 errors when the user doesn't exist in Gitea
+            create_response = http.post(gitea_api_url, headers=gitea_headers, data=payload)
+            create_response.raise_for_status()
+
+            # Add the newly created issue to our mapping to avoid duplicates in the same run
+            new_issue = http.decode_json(create_response)
+            with state_lock:
+                mirrored_issues[pr['number']] = new_issue['number']
+
+            logger.debug(f"Created PR as issue in Gitea: {pr_title} (state: {pr['state']})")
+
+            # Mirror comments for this PR
+            mirror_github_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, pr['number'], new_issue['number'], github_token)
+
+            # Mirror review comments for this PR
+            mirror_github_pr_review_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, github_repo, pr['number'], new_issue['number'], github_token)
+            return 'created'
+        except Exception as e:
+            logger.error(f"Error creating PR as issue in Gitea: {e}")
+            return 'skipped'
+
+    if jobs:
+        # One repo-level listing fills the per-issue comment cache for
+        # every issue at once, so the comment mirrors running inside the
+        # write workers skip their per-issue pagination
+        prefill_gitea_comment_cache(gitea_token, gitea_url, gitea_owner, gitea_repo)
+
+        with ThreadPoolExecutor(max_workers=min(MAX_GITEA_WRITE_WORKERS, len(jobs))) as executor:
+            for outcome in executor.map(write_pr, jobs):
+                if outcome == 'created':
+                    created_count += 1
+                elif outcome == 'updated':
+                    updated_count += 1
+                else:
+                    skipped_count += 1
+
     logger.info(f"Pull requests mirroring summary: {created_count} created, {updated_count} updated, {skipped_count} skipped")
     return True
 
@@ -415,9 +457,7 @@ def mirror_github_pr_review_comments(gitea_token, gitea_url, gitea_owner, gitea_
     try:
         # Get PR reviews from GitHub
         reviews_url = f"https://api.github.com/repos/{github_repo}/pulls/{github_pr_number}/reviews"
-        reviews_response = requests.get(reviews_url, headers=github_headers)
-        reviews_response.raise_for_status()
-        reviews = reviews_response.json()
+        reviews, _ = http.get_json_cached(reviews_url, headers=github_headers)
         
         if not reviews:
             logger.info(f"No reviews found for PR #{github_pr_number}")
@@ -427,9 +467,7 @@ def mirror_github_pr_review_comments(gitea_token, gitea_url, gitea_owner, gitea_
         
         # Get review comments from GitHub
         comments_url = f"https://api.github.com/repos/{github_repo}/pulls/{github_pr_number}/comments"
-        comments_response = requests.get(comments_url, headers=github_headers)
-        comments_response.raise_for_status()
-        review_comments = comments_response.json()
+        review_comments, _ = http.get_json_cached(comments_url, headers=github_headers)
         
         logger.info(f"Found {len(review_comments)} review comments for PR #{github_pr_number}")
         
@@ -437,53 +475,25 @@ def mirror_github_pr_review_comments(gitea_token, gitea_url, gitea_owner, gitea_
         gitea_api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/issues/{gitea_issue_number}/comments"
         
         try:
-            # Get all comments with pagination
-            gitea_comments = []
-            gitea_page = 1
-            
-            while True:
-                gitea_comments_response = requests.get(
-                    gitea_api_url, 
-                    headers=gitea_headers, 
-                    params={'page': gitea_page, 'limit': 50}
-                )
-                gitea_comments_response.raise_for_status()
-                
-                page_comments = gitea_comments_response.json()
-                if not page_comments:
-                    break  # No more comments
-                    
-                gitea_comments.extend(page_comments)
-                
-                # Check if there are more pages
-                if len(page_comments) < 50:
-                    break
-                    
-                gitea_page += 1
-            
-            # Create a set of comment fingerprints to avoid duplicates
-            existing_comment_fingerprints = set()
+            # The issue-comment mirror for this PR listed the same issue
+            # just before us; the shared cache saves that second pagination
+            gitea_comments = get_gitea_issue_comments(gitea_token, gitea_url, gitea_owner, gitea_repo, gitea_issue_number)
             
+            # Collect the GitHub ids of reviews and review comments we
+            # have already mirrored, each embedded as an HTML comment
+            # marker in the body it was created with
+            existing_review_ids = set()
+            existing_review_comment_ids = set()
+
             for comment in gitea_comments:
-                if comment['body'] and ('*Mirrored from GitHub review by @' in comment['body'] or 
-                                        '*Mirrored from GitHub review comment by @' in comment['body']):
-                    # Extract the GitHub comment fingerprint
-                    try:
-                        body_lines = comment['body'].split('\n')
-                        for i, line in enumerate(body_lines):
-                            if '*Mirrored from GitHub review' in line:
-                                # Get the author from this line
-                                author = line.split('@')[1].split('*')[0]
-                                # Get the content from the next lines
-                                content_start = i + 3  # Skip the author line, created at line, and blank line
-                                if content_start < len(body_lines):
-                                    content = '\n'.join(body_lines[content_start:])
-                                    content_preview = content[:50]
-                                    fingerprint = f"{author}:{content_preview}"
-                                    existing_comment_fingerprints.add(fingerprint)
-                                break
-                    except (ValueError, IndexError) as e:
-                        logger.warning(f"Failed to extract GitHub review comment fingerprint: {e}")
+                body = comment['body'] or ''
+                id_match = _GH_REVIEW_ID_RE.search(body)
+                if id_match:
+                    existing_review_ids.add(int(id_match.group(1)))
+                    continue
+                id_match = _GH_REVIEW_COMMENT_ID_RE.search(body)
+                if id_match:
+                    existing_review_comment_ids.add(int(id_match.group(1)))
             
             # First, mirror the reviews
             created_count = 0
@@ -495,23 +505,21 @@ def mirror_github_pr_review_comments(gitea_token, gitea_url, gitea_owner, gitea_
                     if not review.get('body'):
                         continue
                     
-                    # Create a fingerprint for this review
                     author = review['user']['login']
                     content = review['body']
-                    content_preview = content[:50]
-                    fingerprint = f"{author}:{content_preview}"
-                    
-                    # Skip if we've already processed this review
-                    if fingerprint in existing_comment_fingerprints:
+
+                    # Skip if we've already mirrored this review
+                    if review['id'] in existing_review_ids:
                         logger.debug(f"Skipping already processed GitHub review by @{author}")
                         skipped_count += 1
                         continue
                     
                     # Format the review body
                     review_state = review.get('state', 'COMMENTED').upper()
-                    comment_body = f"*Mirrored from GitHub review by @{author}*\n\n"
-                    comment_body += f"**Review state: {review_state}**\n\n"
-                    comment_body += f"**Created at: {review.get('submitted_at', 'unknown time')}**\n\n"
+                    comment_parts = [f"<!-- gh-review-id:{review['id']} -->\n"]
+                    comment_parts.append(f"*Mirrored from GitHub review by @{author}*\n\n")
+                    comment_parts.append(f"**Review state: {review_state}**\n\n")
+                    comment_parts.append(f"**Created at: {review.get('submitted_at', 'unknown time')}**\n\n")
                     
                     # Process the content to ensure proper formatting
                     processed_content = content
@@ -522,31 +530,26 @@ def mirror_github_pr_review_comments(gitea_token, gitea_url, gitea_owner, gitea_
                         processed_content = processed_content.replace('\r\n', '\n').replace('\r', '\n')
                         
                         # Only ensure quotes have a space after '>'
-                        lines = processed_content.split('\n')
-                        for i in range(len(lines)):
-                            if lines[i].startswith('>') and not lines[i].startswith('> ') and len(lines[i]) > 1:
-                                lines[i] = '> ' + lines[i][1:]
-                        
-                        processed_content = '\n'.join(lines)
+                        processed_content = _QUOTE_FIX_RE.sub('> ', processed_content)
                     
                     # Add the processed content
                     if processed_content:
-                        comment_body += processed_content
+                        comment_parts.append(processed_content)
                     
                     # Create comment in Gitea
                     comment_data = {
-                        'body': comment_body
+                        'body': ''.join(comment_parts)
                     }
                     
                     try:
-                        create_response = requests.post(gitea_api_url, headers=gitea_headers, json=comment_data)
+                        create_response = http.post(gitea_api_url, headers=gitea_headers, data=http.dumps_bytes(comment_data))
                         create_response.raise_for_status()
                         
                         created_count += 1
                         logger.info(f"Created review comment in Gitea issue #{gitea_issue_number} by @{author}")
                         
-                        # Add to our set of processed comments
-                        existing_comment_fingerprints.add(fingerprint)
+                        # Add to our set of processed reviews
+                        existing_review_ids.add(review['id'])
                     except Exception as e:
                         logger.error(f"Error creating review comment in Gitea: {e}")
                         logger.error(f"Response status: {getattr(create_response, 'status_code', 'unknown')}")
@@ -559,30 +562,27 @@ def mirror_github_pr_review_comments(gitea_token, gitea_url, gitea_owner, gitea_
             # Then, mirror the review comments (inline comments on code)
             for comment in review_comments:
                 try:
-                    # Create a fingerprint for this comment
                     author = comment['user']['login']
                     content = comment['body'] or ""
-                    content_preview = content[:50]
-                    fingerprint = f"{author}:{content_preview}"
-                    
-                    # Skip if we've already processed this comment
-                    if fingerprint in existing_comment_fingerprints:
+
+                    # Skip if we've already mirrored this comment
+                    if comment['id'] in existing_review_comment_ids:
                         logger.debug(f"Skipping already processed GitHub review comment by @{author}")
                         skipped_count += 1
                         continue
                     
                     # Format the comment body
                     path = comment.get('path', 'unknown file')
-                    position = comment.get('position', 'unknown position')
-                    comment_body = f"*Mirrored from GitHub review comment by @{author}*\n\n"
-                    comment_body += f"**Created at: {comment.get('created_at', 'unknown time')}**\n\n"
-                    comment_body += f"**File: `{path}`**\n\n"
+                    comment_parts = [f"<!-- gh-review-comment-id:{comment['id']} -->\n"]
+                    comment_parts.append(f"*Mirrored from GitHub review comment by @{author}*\n\n")
+                    comment_parts.append(f"**Created at: {comment.get('created_at', 'unknown time')}**\n\n")
+                    comment_parts.append(f"**File: `{path}`**\n\n")
                     
                     # Add diff context if available
                     if comment.get('diff_hunk'):
-                        comment_body += "**Code context:**\n```diff\n"
-                        comment_body += comment['diff_hunk']
-                        comment_body += "\n```\n\n"
+                        comment_parts.append("**Code context:**\n```diff\n")
+                        comment_parts.append(comment['diff_hunk'])
+                        comment_parts.append("\n```\n\n")
                     
                     # Process the content to ensure proper formatting
                     processed_content = content
@@ -593,31 +593,26 @@ def mirror_github_pr_review_comments(gitea_token, gitea_url, gitea_owner, gitea_
                         processed_content = processed_content.replace('\r\n', '\n').replace('\r', '\n')
                         
                         # Only ensure quotes have a space after '>'
-                        lines = processed_content.split('\n')
-                        for i in range(len(lines)):
-                            if lines[i].startswith('>') and not lines[i].startswith('> ') and len(lines[i]) > 1:
-                                lines[i] = '> ' + lines[i][1:]
-                        
-                        processed_content = '\n'.join(lines)
+                        processed_content = _QUOTE_FIX_RE.sub('> ', processed_content)
                     
                     # Add the processed content
                     if processed_content:
-                        comment_body += processed_content
+                        comment_parts.append(processed_content)
                     
                     # Create comment in Gitea
                     comment_data = {
-                        'body': comment_body
+                        'body': ''.join(comment_parts)
                     }
                     
                     try:
-                        create_response = requests.post(gitea_api_url, headers=gitea_headers, json=comment_data)
+                        create_response = http.post(gitea_api_url, headers=gitea_headers, data=http.dumps_bytes(comment_data))
                         create_response.raise_for_status()
                         
                         created_count += 1
                         logger.info(f"Created review comment in Gitea issue #{gitea_issue_number} by @{author}")
                         
                         # Add to our set of processed comments
-                        existing_comment_fingerprints.add(fingerprint)
+                        existing_review_comment_ids.add(comment['id'])
                     except Exception as e:
                         logger.error(f"Error creating review comment in Gitea: {e}")
                         logger.error(f"Response status: {getattr(create_response, 'status_code', 'unknown')}")
@@ -627,6 +622,9 @@ def mirror_github_pr_review_comments(gitea_token, gitea_url, gitea_owner, gitea_
                     logger.error(f"Error processing review comment: {e}")
                     skipped_count += 1
             
+            if created_count:
+                forget_gitea_issue_comments(gitea_url, gitea_owner, gitea_repo, gitea_issue_number)
+
             logger.info(f"Review comments mirroring summary for PR #{github_pr_number}: {created_count} created, {skipped_count} skipped")
             return True
             
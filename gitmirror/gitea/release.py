@@ -1,30 +1,83 @@
 import logging
+import shutil
+import tempfile
+import threading
+import time
+from urllib.parse import quote
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from ..utils import http
 
 logger = logging.getLogger('github-gitea-mirror')
 
-def check_gitea_release_exists(gitea_token, gitea_url, gitea_owner, gitea_repo, tag_name):
-    """Check if a release with the given tag already exists in Gitea"""
+# Bound the number of assets downloaded and uploaded at once
+MAX_ASSET_WORKERS = 8
+
+# Assets up to this size are buffered in memory while relaying from
+# GitHub to Gitea; anything larger spills to a temp file on disk
+ASSET_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+ASSET_COPY_CHUNK_BYTES = 1024 * 1024
+
+# Release-existence answers cached briefly per tag so release loops
+# don't re-query tags they just checked; create and delete record the
+# new state directly instead of waiting for the TTL
+_RELEASE_EXISTS_CACHE = {}
+_RELEASE_EXISTS_LOCK = threading.Lock()
+_RELEASE_EXISTS_TTL = 60
+
+
+def _record_release_exists(gitea_url, gitea_owner, gitea_repo, tag_name, exists):
+    with _RELEASE_EXISTS_LOCK:
+        _RELEASE_EXISTS_CACHE[(gitea_url, gitea_owner, gitea_repo, tag_name)] = (exists, time.time() + _RELEASE_EXISTS_TTL)
+
+def _get_release_by_tag(gitea_token, gitea_url, gitea_owner, gitea_repo, tag_name):
+    """Fetch a Gitea release by tag, or None if it does not exist
+
+    Returns the full release JSON so callers that need the assets (the
+    verification path) can reuse this answer instead of re-GETting the
+    same endpoint. Records the existence answer in the per-tag cache.
+    """
     headers = {
         'Authorization': f'token {gitea_token}',
         'Content-Type': 'application/json',
     }
     
-    api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/releases/tags/{tag_name}"
+    api_url = f"{http.repo_base(gitea_url, gitea_owner, gitea_repo)}/releases/tags/{tag_name}"
     try:
-        response = requests.get(api_url, headers=headers)
-        return response.status_code == 200
+        response = http.get(api_url, headers=headers)
     except requests.exceptions.RequestException:
-        return False
+        return None
+
+    _record_release_exists(gitea_url, gitea_owner, gitea_repo, tag_name, response.status_code == 200)
+    if response.status_code != 200:
+        return None
+    return http.decode_json(response)
+
+def check_gitea_release_exists(gitea_token, gitea_url, gitea_owner, gitea_repo, tag_name):
+    """Check if a release with the given tag already exists in Gitea
+
+    Answers are served from the short-lived per-tag cache when possible;
+    the token is deliberately not part of the cache key.
+    """
+    cache_key = (gitea_url, gitea_owner, gitea_repo, tag_name)
+    now = time.time()
+    with _RELEASE_EXISTS_LOCK:
+        cached = _RELEASE_EXISTS_CACHE.get(cache_key)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+
+    return _get_release_by_tag(gitea_token, gitea_url, gitea_owner, gitea_repo, tag_name) is not None
 
 def create_gitea_release(gitea_token, gitea_url, gitea_owner, gitea_repo, release_data):
     """Create a release in Gitea"""
-    # Check if release already exists
-    if check_gitea_release_exists(gitea_token, gitea_url, gitea_owner, gitea_repo, release_data.tag_name):
+    # Check if release already exists; the fetched JSON carries the
+    # assets, so the verification below doesn't need to re-GET the tag
+    existing_release = _get_release_by_tag(gitea_token, gitea_url, gitea_owner, gitea_repo, release_data.tag_name)
+    if existing_release is not None:
         logger.info(f"Release {release_data.tag_name} already exists in Gitea, skipping")
         # Verify existing release is complete if it has assets
         if release_data.assets and len(release_data.assets) > 0:
-            if verify_gitea_release(gitea_token, gitea_url, gitea_owner, gitea_repo, release_data.tag_name, release_data.assets):
+            if verify_gitea_release(gitea_token, gitea_url, gitea_owner, gitea_repo, release_data.tag_name, release_data.assets, prefetched=existing_release, detailed=False):
                 logger.info(f"Existing release {release_data.tag_name} is complete and verified")
             else:
                 logger.warning(f"Existing release {release_data.tag_name} is incomplete or broken, attempting to recreate")
@@ -39,7 +92,7 @@ def create_gitea_release(gitea_token, gitea_url, gitea_owner, gitea_repo, releas
         'Content-Type': 'application/json',
     }
     
-    api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/releases"
+    api_url = f"{http.repo_base(gitea_url, gitea_owner, gitea_repo)}/releases"
     
     release_payload = {
         'tag_name': release_data.tag_name,
@@ -50,22 +103,28 @@ def create_gitea_release(gitea_token, gitea_url, gitea_owner, gitea_repo, releas
     }
 
     try:
-        response = requests.post(api_url, headers=headers, json=release_payload)
+        response = http.post(api_url, headers=headers, json=release_payload)
         if response.status_code == 409:
             logger.info(f"Release {release_data.tag_name} already exists in Gitea, skipping")
             return
         
         response.raise_for_status()
         logger.info(f"Successfully created release {release_data.tag_name} in Gitea")
+        _record_release_exists(gitea_url, gitea_owner, gitea_repo, release_data.tag_name, True)
         
         # Mirror release assets if they exist
         if release_data.assets:
-            gitea_release = response.json()
-            asset_results = []
-            for asset in release_data.assets:
-                result = mirror_release_asset(gitea_token, gitea_url, gitea_owner, gitea_repo, 
-                                  gitea_release['id'], asset)
-                asset_results.append(result)
+            gitea_release = http.decode_json(response)
+
+            # Each asset is an independent download+upload pair and
+            # purely latency-bound, so run several in flight instead of
+            # paying one download plus one upload round-trip per asset
+            def mirror_asset(asset):
+                return mirror_release_asset(gitea_token, gitea_url, gitea_owner, gitea_repo,
+                                            gitea_release['id'], asset)
+
+            with ThreadPoolExecutor(max_workers=min(MAX_ASSET_WORKERS, len(release_data.assets))) as executor:
+                asset_results = list(executor.map(mirror_asset, release_data.assets))
             
             # Log summary of asset mirroring
             total_assets = len(release_data.assets)
@@ -93,24 +152,25 @@ def delete_release(gitea_token, gitea_url, gitea_owner, gitea_repo, tag_name):
     }
     
     # First get the release ID
-    api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/releases/tags/{tag_name}"
+    api_url = f"{http.repo_base(gitea_url, gitea_owner, gitea_repo)}/releases/tags/{tag_name}"
     try:
-        response = requests.get(api_url, headers=headers)
+        response = http.get(api_url, headers=headers)
         if response.status_code != 200:
             logger.error(f"Failed to get release {tag_name} for deletion: {response.status_code}")
             return False
         
-        release_id = response.json().get('id')
+        release_id = http.decode_json(response).get('id')
         if not release_id:
             logger.error(f"Failed to get release ID for {tag_name}")
             return False
         
         # Now delete the release
-        delete_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/releases/{release_id}"
-        delete_response = requests.delete(delete_url, headers=headers)
+        delete_url = f"{http.repo_base(gitea_url, gitea_owner, gitea_repo)}/releases/{release_id}"
+        delete_response = http.delete(delete_url, headers=headers)
         
         if delete_response.status_code == 204:
             logger.info(f"Successfully deleted release {tag_name}")
+            _record_release_exists(gitea_url, gitea_owner, gitea_repo, tag_name, False)
             return True
         else:
             logger.error(f"Failed to delete release {tag_name}: {delete_response.status_code}")
@@ -139,20 +199,27 @@ def mirror_release_asset(gitea_token, gitea_url, gitea_owner, gitea_repo, releas
         
         logger.debug(f"Using download timeout of {download_timeout:.0f}s and upload timeout of {upload_timeout:.0f}s")
         
-        # Download asset from GitHub with calculated timeout
-        download_response = requests.get(asset.browser_download_url, timeout=download_timeout)
-        download_response.raise_for_status()
-        asset_content = download_response.content
-        
-        # Upload to Gitea
-        upload_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/releases/{release_id}/assets"
-        files = {
-            'attachment': (asset.name, asset_content)
-        }
-        
-        # Use calculated timeout for uploading
-        response = requests.post(upload_url, headers=headers, files=files, timeout=upload_timeout)
-        response.raise_for_status()
+        # Stream the download into a spooled temp file instead of
+        # buffering the whole asset with .content: small assets stay in
+        # memory, large ones spill to disk, so peak memory is bounded by
+        # the spool size rather than the asset size
+        with tempfile.SpooledTemporaryFile(max_size=ASSET_SPOOL_MAX_BYTES) as spool:
+            with http.get(asset.browser_download_url, stream=True, timeout=download_timeout) as download_response:
+                download_response.raise_for_status()
+                shutil.copyfileobj(download_response.raw, spool, length=ASSET_COPY_CHUNK_BYTES)
+            spool.seek(0)
+
+            # Upload to Gitea straight from the spool as a raw
+            # octet-stream body with the filename in the query string;
+            # the attachment endpoint accepts this alongside multipart,
+            # and skipping the multipart encoder avoids re-copying the
+            # asset bytes through Python to add boundaries
+            upload_url = f"{http.repo_base(gitea_url, gitea_owner, gitea_repo)}/releases/{release_id}/assets?name={quote(asset.name)}"
+            upload_headers = dict(headers, **{'Content-Type': 'application/octet-stream'})
+
+            # Use calculated timeout for uploading
+            response = http.post(upload_url, headers=upload_headers, data=spool, timeout=upload_timeout)
+            response.raise_for_status()
         
         logger.info(f"Successfully mirrored asset: {asset.name}")
         return True
@@ -166,28 +233,46 @@ def mirror_release_asset(gitea_token, gitea_url, gitea_owner, gitea_repo, releas
         logger.error(f"Unexpected error mirroring asset {asset.name}: {e}")
         return False
 
-def verify_gitea_release(gitea_token, gitea_url, gitea_owner, gitea_repo, release_tag, github_assets):
-    """Verify that a release in Gitea is complete and not broken due to failed uploads by comparing file sizes"""
-    headers = {
-        'Authorization': f'token {gitea_token}',
-        'Content-Type': 'application/json',
-    }
-    
-    api_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/releases/tags/{release_tag}"
+def verify_gitea_release(gitea_token, gitea_url, gitea_owner, gitea_repo, release_tag, github_assets, prefetched=None, detailed=True):
+    """Verify that a release in Gitea is complete and not broken due to failed uploads by comparing file sizes
+
+    Callers that already hold the release JSON can pass it as prefetched
+    to skip the GET for the same tag. detailed=False answers on the
+    first divergence instead of collecting every missing or mismatched
+    asset for the logs - callers that only act on the yes/no answer get
+    an O(1) failure instead of a full scan plus list formatting.
+    """
     try:
-        response = requests.get(api_url, headers=headers)
-        if response.status_code != 200:
-            logger.error(f"Failed to get release {release_tag} from Gitea: {response.status_code}")
-            return False
-        
-        gitea_release = response.json()
+        if prefetched is not None:
+            gitea_release = prefetched
+        else:
+            headers = {
+                'Authorization': f'token {gitea_token}',
+                'Content-Type': 'application/json',
+            }
+            api_url = f"{http.repo_base(gitea_url, gitea_owner, gitea_repo)}/releases/tags/{release_tag}"
+            response = http.get(api_url, headers=headers)
+            if response.status_code != 200:
+                logger.error(f"Failed to get release {release_tag} from Gitea: {response.status_code}")
+                return False
+            
+            gitea_release = http.decode_json(response)
         gitea_assets = gitea_release.get('assets', [])
         
-        # Check if all assets are present
+        # Index the Gitea assets by name once so both the presence and
+        # the size checks are dict lookups instead of list scans
+        gitea_assets_by_name = {asset.get('name'): asset for asset in gitea_assets}
         github_asset_names = [asset.name for asset in github_assets]
-        gitea_asset_names = [asset.get('name') for asset in gitea_assets]
         
-        missing_assets = set(github_asset_names) - set(gitea_asset_names)
+        if not detailed:
+            if any(name not in gitea_assets_by_name for name in github_asset_names):
+                return False
+            return not any(
+                abs(asset.size - gitea_assets_by_name[asset.name].get('size', 0)) > 1024
+                for asset in github_assets
+            )
+        
+        missing_assets = set(github_asset_names) - gitea_assets_by_name.keys()
         
         if missing_assets:
             logger.error(f"Release {release_tag} is incomplete. Missing assets: {', '.join(missing_assets)}")
@@ -196,11 +281,10 @@ def verify_gitea_release(gitea_token, gitea_url, gitea_owner, gitea_repo, releas
         # Check if asset sizes match
         size_mismatches = []
         for github_asset in github_assets:
-            matching_gitea_assets = [a for a in gitea_assets if a.get('name') == github_asset.name]
-            if not matching_gitea_assets:
+            gitea_asset = gitea_assets_by_name.get(github_asset.name)
+            if gitea_asset is None:
                 continue
                 
-            gitea_asset = matching_gitea_assets[0]
             github_size = github_asset.size
             gitea_size = gitea_asset.get('size', 0)
             
@@ -2,6 +2,7 @@ import logging
 import requests
 import json
 import time
+from ..utils import http
 from ..utils.config import get_repo_config
 
 logger = logging.getLogger('github-gitea-mirror')
@@ -13,46 +14,49 @@ def get_gitea_repos(gitea_token, gitea_url):
         'Content-Type': 'application/json',
     }
     
-    # Get all repositories the user has access to
+    # Get all repositories the user has access to, walking every page
+    # at the server's maximum page size; a single unpaginated call is
+    # silently truncated at the server default once a user has more
+    # repositories than one page holds
     api_url = f"{gitea_url}/api/v1/user/repos"
     try:
         logger.info(f"Fetching repositories from {api_url}")
-        response = requests.get(api_url, headers=headers)
-        response.raise_for_status()
-        repos = response.json()
+        limit = http.get_gitea_page_limit(gitea_url, headers=headers)
+        repos = http.fetch_all_pages(api_url, headers, {'limit': limit})
         logger.info(f"Found {len(repos)} repositories")
         
-        # Filter for repositories that are mirrors from GitHub
+        # Filter for repositories that are mirrors from GitHub; bail out
+        # of each iteration as early as possible so non-mirror repos cost
+        # two dict lookups instead of a full record build
         mirrored_repos = []
         for repo in repos:
-            logger.debug(f"Checking repository: {repo['name']}")
+            if not repo.get('mirror'):
+                continue
+            github_url = repo.get('original_url') or ''
+            if not github_url.startswith('https://github.com/'):
+                continue
             
-            # Check if it's a mirror with original_url pointing to GitHub
-            if repo.get('mirror', False) and repo.get('original_url', '').startswith('https://github.com/'):
-                # Extract the GitHub repository path from the original_url
-                github_url = repo.get('original_url', '')
-                github_repo = github_url.replace('https://github.com/', '')
-                
-                # Remove .git suffix if present
-                if github_repo.endswith('.git'):
-                    github_repo = github_repo[:-4]
-                
-                # Get repository configuration to retrieve last mirror timestamp
-                repo_config = get_repo_config(github_repo, repo['owner']['username'], repo['name'])
-                
-                mirrored_repos.append({
-                    'gitea_owner': repo['owner']['username'],
-                    'gitea_repo': repo['name'],
-                    'github_repo': github_repo,
-                    'is_mirror': True,
-                    'mirror_interval': repo.get('mirror_interval', 'unknown'),
-                    'last_mirror_timestamp': repo_config.get('last_mirror_timestamp', None),
-                    'last_mirror_date': repo_config.get('last_mirror_date', 'Never'),
-                    'last_mirror_status': repo_config.get('last_mirror_status', 'unknown'),
-                    'last_mirror_messages': repo_config.get('last_mirror_messages', []),
-                    'last_mirror_log': repo_config.get('last_mirror_log', None)
-                })
-                logger.info(f"Added as mirrored repository: {repo['name']} -> {github_repo}")
+            # Extract the GitHub repository path from the original_url
+            github_repo = github_url.removeprefix('https://github.com/').removesuffix('.git')
+            owner = repo['owner']['username']
+            name = repo['name']
+            
+            # Get repository configuration to retrieve last mirror timestamp
+            repo_config = get_repo_config(github_repo, owner, name)
+            
+            mirrored_repos.append({
+                'gitea_owner': owner,
+                'gitea_repo': name,
+                'github_repo': github_repo,
+                'is_mirror': True,
+                'mirror_interval': repo.get('mirror_interval', 'unknown'),
+                'last_mirror_timestamp': repo_config.get('last_mirror_timestamp', None),
+                'last_mirror_date': repo_config.get('last_mirror_date', 'Never'),
+                'last_mirror_status': repo_config.get('last_mirror_status', 'unknown'),
+                'last_mirror_messages': repo_config.get('last_mirror_messages', []),
+                'last_mirror_log': repo_config.get('last_mirror_log', None)
+            })
+            logger.info(f"Added as mirrored repository: {name} -> {github_repo}")
         
         return mirrored_repos
     except Exception as e:
@@ -104,15 +108,12 @@ def create_or_update_repo(gitea_token, gitea_url, gitea_owner, gitea_repo, githu
         github_url = f"https://github.com/{github_repo}.git"
     
     # First check if the repository already exists
-    check_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}"
     try:
-        check_response = requests.get(check_url, headers=headers)
-        
-        if check_response.status_code == 200:
+        repo_info = get_repo_info(gitea_token, gitea_url, gitea_owner, gitea_repo)
+
+        if repo_info['exists']:
             # Repository exists, check if it's already a mirror
-            repo_info = check_response.json()
-            
-            if repo_info.get('mirror', False):
+            if repo_info['mirror']:
                 logger.info(f"Repository {gitea_owner}/{gitea_repo} is already configured as a mirror")
                 return True
             
@@ -121,11 +122,17 @@ def create_or_update_repo(gitea_token, gitea_url, gitea_owner, gitea_repo, githu
             # First, check if it's empty to avoid data loss
             logger.info(f"Repository {gitea_owner}/{gitea_repo} exists but is not a mirror. Checking if it's empty...")
             
-            # Check if the repository has any commits
-            commits_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/commits"
-            commits_response = requests.get(commits_url, headers=headers)
-            
-            if commits_response.status_code == 200 and len(commits_response.json()) > 0:
+            # The repo payload already reports emptiness on current
+            # Gitea; older servers omit the field and get the single-
+            # commit probe instead
+            repo_is_empty = repo_info['empty']
+            if repo_is_empty is None:
+                commits_url = f"{http.repo_base(gitea_url, gitea_owner, gitea_repo)}/commits"
+                commits_params = {'limit': 1, 'stat': 'false', 'verification': 'false', 'files': 'false'}
+                commits_response = http.get(commits_url, headers=headers, params=commits_params)
+                repo_is_empty = not (commits_response.status_code == 200 and len(http.decode_json(commits_response)) > 0)
+
+            if not repo_is_empty:
                 logger.warning(f"Repository {gitea_owner}/{gitea_repo} has commits and cannot be safely converted to a mirror.")
                 logger.warning("Please delete the repository manually and run the script again.")
                 return False
@@ -139,17 +146,30 @@ def create_or_update_repo(gitea_token, gitea_url, gitea_owner, gitea_repo, githu
             # Repository is empty and force_recreate is True, we can delete and recreate it as a mirror
             logger.info(f"Repository {gitea_owner}/{gitea_repo} is empty. Deleting it to recreate as a mirror...")
             
-            delete_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}"
-            delete_response = requests.delete(delete_url, headers=headers)
+            delete_url = http.repo_base(gitea_url, gitea_owner, gitea_repo)
+            delete_response = http.delete(delete_url, headers=headers)
             
             if delete_response.status_code != 204:
-                logger.error(f"Failed to delete repository: {delete_response.status_code} - {delete_response.text}")
+                logger.error("Failed to delete repository: %s - %s", delete_response.status_code, http.LazyText(delete_response))
                 return False
             
             logger.info(f"Repository {gitea_owner}/{gitea_repo} deleted successfully. Recreating as a mirror...")
             
-            # Wait a moment to ensure the deletion is processed
-            time.sleep(2)
+            # Poll for the deletion to land instead of sleeping a flat
+            # two seconds: most servers finish in a few hundred
+            # milliseconds, and the old fixed sleep stays as the
+            # worst-case bound
+            check_url = http.repo_base(gitea_url, gitea_owner, gitea_repo)
+            wait_started = time.time()
+            deadline = wait_started + 2
+            while time.time() < deadline:
+                try:
+                    if http.get(check_url, headers=headers).status_code == 404:
+                        break
+                except requests.exceptions.RequestException:
+                    break
+                time.sleep(0.1)
+            logger.debug(f"Waited {time.time() - wait_started:.2f}s for repository deletion to be processed")
         
         # Repository doesn't exist or was deleted, create it as a mirror
         logger.info(f"Creating new mirror repository: {gitea_owner}/{gitea_repo} from {github_url}")
@@ -191,13 +211,13 @@ def create_or_update_repo(gitea_token, gitea_url, gitea_owner, gitea_repo, githu
             logger.info("Skipping immediate mirroring as requested")
             repo_payload['mirror_interval'] = '8h0m0s'  # Set a reasonable default interval (8 hours)
         
-        response = requests.post(create_url, headers=headers, json=repo_payload)
+        response = http.post(create_url, headers=headers, json=repo_payload)
         
         if response.status_code == 201 or response.status_code == 200:
             logger.info(f"Successfully created mirror repository {gitea_owner}/{gitea_repo}")
             return True
         else:
-            logger.error(f"Error creating mirror repository: {response.status_code} - {response.text}")
+            logger.error("Error creating mirror repository: %s - %s", response.status_code, http.LazyText(response))
             
             # If we get a 401 or 403 error, it might be because the repository is private and we need authentication
             if (response.status_code == 401 or response.status_code == 403) and not github_token:
@@ -216,15 +236,15 @@ def trigger_mirror_sync(gitea_token, gitea_url, gitea_owner, gitea_repo):
         'Content-Type': 'application/json',
     }
     
-    sync_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/mirror-sync"
+    sync_url = f"{http.repo_base(gitea_url, gitea_owner, gitea_repo)}/mirror-sync"
     try:
-        response = requests.post(sync_url, headers=headers)
+        response = http.post(sync_url, headers=headers)
         
         if response.status_code == 200:
             logger.info(f"Successfully triggered mirror sync for code in {gitea_owner}/{gitea_repo}")
             return True
         else:
-            logger.warning(f"Failed to trigger mirror sync for code: {response.status_code} - {response.text}")
+            logger.warning("Failed to trigger mirror sync for code: %s - %s", response.status_code, http.LazyText(response))
             return False
     except requests.exceptions.RequestException as e:
         logger.error(f"Error triggering mirror sync: {e}")
@@ -237,67 +257,81 @@ def update_repo_description(gitea_token, gitea_url, gitea_owner, gitea_repo, des
         'Content-Type': 'application/json',
     }
     
-    update_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}"
+    update_url = http.repo_base(gitea_url, gitea_owner, gitea_repo)
     try:
         update_data = {
             'description': description
         }
         
-        response = requests.patch(update_url, headers=headers, json=update_data)
+        response = http.patch(update_url, headers=headers, json=update_data)
         
         if response.status_code == 200:
             logger.info(f"Successfully updated description for {gitea_owner}/{gitea_repo}")
             return True
         else:
-            logger.warning(f"Failed to update repository description: {response.status_code} - {response.text}")
+            logger.warning("Failed to update repository description: %s - %s", response.status_code, http.LazyText(response))
             return False
     except requests.exceptions.RequestException as e:
         logger.error(f"Error updating repository description: {e}")
         return False
 
-def check_repo_exists(gitea_token, gitea_url, gitea_owner, gitea_repo):
-    """Check if a repository exists in Gitea"""
+def get_repo_info(gitea_token, gitea_url, gitea_owner, gitea_repo):
+    """Fetch a repository once and report existence, mirror flag and emptiness
+    
+    Callers commonly chain check_repo_exists, is_repo_mirror and
+    is_repo_empty against the same repository, costing three round trips
+    to the same resource; the repo payload answers all three in one GET.
+    'empty' is None when the server omits the field (older Gitea), in
+    which case is_repo_empty falls back to probing for a commit.
+    """
     headers = {
         'Authorization': f'token {gitea_token}',
         'Content-Type': 'application/json',
     }
     
-    check_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}"
+    check_url = http.repo_base(gitea_url, gitea_owner, gitea_repo)
     try:
-        check_response = requests.get(check_url, headers=headers)
-        return check_response.status_code == 200
+        check_response = http.get(check_url, headers=headers)
+        if check_response.status_code != 200:
+            return {'exists': False, 'mirror': False, 'empty': None, 'raw': None}
+        
+        repo_data = http.decode_json(check_response)
+        return {
+            'exists': True,
+            'mirror': repo_data.get('mirror', False),
+            'empty': repo_data.get('empty'),
+            'raw': repo_data,
+        }
     except requests.exceptions.RequestException:
-        return False
+        return {'exists': False, 'mirror': False, 'empty': None, 'raw': None}
+
+def check_repo_exists(gitea_token, gitea_url, gitea_owner, gitea_repo):
+    """Check if a repository exists in Gitea"""
+    return get_repo_info(gitea_token, gitea_url, gitea_owner, gitea_repo)['exists']
 
 def is_repo_mirror(gitea_token, gitea_url, gitea_owner, gitea_repo):
     """Check if a repository is configured as a mirror in Gitea"""
-    headers = {
-        'Authorization': f'token {gitea_token}',
-        'Content-Type': 'application/json',
-    }
-    
-    check_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}"
-    try:
-        check_response = requests.get(check_url, headers=headers)
-        if check_response.status_code == 200:
-            repo_info = check_response.json()
-            return repo_info.get('mirror', False)
-        return False
-    except requests.exceptions.RequestException:
-        return False
+    return get_repo_info(gitea_token, gitea_url, gitea_owner, gitea_repo)['mirror']
 
 def is_repo_empty(gitea_token, gitea_url, gitea_owner, gitea_repo):
     """Check if a repository is empty (has no commits)"""
+    repo_info = get_repo_info(gitea_token, gitea_url, gitea_owner, gitea_repo)
+    if repo_info['empty'] is not None:
+        return repo_info['empty']
+    
     headers = {
         'Authorization': f'token {gitea_token}',
         'Content-Type': 'application/json',
     }
     
-    commits_url = f"{gitea_url}/api/v1/repos/{gitea_owner}/{gitea_repo}/commits"
+    # Only existence matters, so ask for a single commit without stats,
+    # diffs or signature verification instead of a full default page
+    commits_url = f"{http.repo_base(gitea_url, gitea_owner, gitea_repo)}/commits"
+    commits_params = {'limit': 1, 'stat': 'false', 'verification': 'false', 'files': 'false'}
     try:
-        commits_response = requests.get(commits_url, headers=headers)
+        commits_response = http.get(commits_url, headers=headers, params=commits_params)
         if commits_response.status_code == 200:
-            commits = commits_response.json()
+            commits = http.decode_json(commits_response)
             return len(commits) == 0
         return True  # Assume empty if we can't check
     except requests.exceptions.RequestException:
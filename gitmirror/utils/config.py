@@ -112,13 +112,20 @@ def get_repo_config(github_repo, gitea_owner, gitea_repo):
     logger.debug(f"Using default config: {default_config}")
     return default_config
 
+# Read caches registered by other modules (functools caches exposing
+# cache_clear); saving any repo config drops their entries so cached
+# readers never serve settings older than the last write
+_config_read_caches = []
+
 def save_repo_config(github_repo, gitea_owner, gitea_repo, config):
     """Save the configuration for a specific repository."""
     config_path = get_repo_config_path(github_repo, gitea_owner, gitea_repo)
-    
+
     try:
         with open(config_path, 'w') as f:
             json.dump(config, f, indent=2)
+        for cache in _config_read_caches:
+            cache.cache_clear()
         return True
     except Exception as e:
         logger.error(f"Error saving repo config for {github_repo} -> {gitea_owner}/{gitea_repo}: {e}")
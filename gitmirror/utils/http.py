@@ -0,0 +1,331 @@
+"""Shared HTTP helpers for the GitHub and Gitea API clients"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlparse, parse_qs
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses and serializes JSON several times faster than the stdlib;
+# fall back to the stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger('github-gitea-mirror')
+
+# A single keep-alive session shared across the process. The module-level
+# requests helpers open a fresh TCP+TLS connection on every call; pooled
+# connections skip that handshake for every request after the first per
+# host, which dominates the cost of small API calls.
+_session = requests.Session()
+# Retry transient failures at the transport layer with backoff. POST is
+# deliberately excluded: a retried POST whose first attempt actually
+# landed would create a duplicate issue or comment.
+_retry = Retry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=[429, 502, 503, 504],
+    allowed_methods=frozenset(['GET', 'PATCH', 'DELETE']),
+)
+_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_retry)
+_session.mount('https://', _adapter)
+_session.mount('http://', _adapter)
+
+
+def decode_json(response):
+    """Parse a response body, using orjson when it is installed
+
+    orjson.loads takes the raw bytes directly, skipping the UTF-8 decode
+    that response.json() performs before parsing.
+    """
+    content = response.content
+    if orjson is not None and isinstance(content, (bytes, bytearray)):
+        return orjson.loads(content)
+    return response.json()
+
+
+def dumps_compact(obj):
+    """Serialize to a compact JSON string, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def dumps_bytes(obj):
+    """Serialize to compact UTF-8 JSON bytes, using orjson when it is installed
+
+    Sending pre-serialized bytes as a request body skips the stdlib
+    serialization requests performs for json= payloads; bytes (not str)
+    so the transport never re-encodes multi-byte content.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+@lru_cache(maxsize=4096)
+def repo_base(gitea_url, owner, repo):
+    """Base /api/v1/repos URL for a repository
+
+    The helpers that check, sync and verify a repository rebuild this
+    same prefix on every call; caching it means tight per-repo loops
+    only format the endpoint suffix.
+    """
+    return f"{gitea_url}/api/v1/repos/{owner}/{repo}"
+
+
+class LazyText:
+    """Defer response-body decoding until a log handler formats the record
+
+    response.text decodes (and charset-sniffs) the whole body the moment
+    it is read. Error logs that interpolate it pay that cost even when
+    the logger level suppresses the record; passing LazyText(response)
+    as a %s argument moves the decode into __str__, which only runs if
+    the record is actually emitted.
+    """
+
+    def __init__(self, response):
+        self._response = response
+
+    def __str__(self):
+        return str(self._response.text)
+
+
+def get(url, **kwargs):
+    """GET through the shared keep-alive session"""
+    return _session.get(url, **kwargs)
+
+
+def post(url, **kwargs):
+    """POST through the shared keep-alive session"""
+    return _session.post(url, **kwargs)
+
+
+def patch(url, **kwargs):
+    """PATCH through the shared keep-alive session"""
+    return _session.patch(url, **kwargs)
+
+
+def delete(url, **kwargs):
+    """DELETE through the shared keep-alive session"""
+    return _session.delete(url, **kwargs)
+
+# Bound the number of page requests that can be in flight at once
+MAX_PAGE_WORKERS = 10
+
+
+# Max page size advertised by each Gitea server, probed once per host
+_page_limit_cache = {}
+_page_limit_lock = threading.Lock()
+
+
+def get_gitea_page_limit(gitea_url, headers=None, default=50):
+    """Return the largest page size a Gitea server will honour
+
+    Probes /api/v1/settings/api for max_response_items once per host and
+    caches the answer. Requesting the server max instead of a hardcoded 50
+    halves the round-trips on servers configured with a larger ceiling;
+    servers that reject or hide the settings endpoint get the default.
+    """
+    with _page_limit_lock:
+        if gitea_url in _page_limit_cache:
+            return _page_limit_cache[gitea_url]
+
+    try:
+        response = get(f"{gitea_url}/api/v1/settings/api", headers=headers)
+        response.raise_for_status()
+        limit = int(decode_json(response).get('max_response_items') or default)
+    except Exception as e:
+        logger.debug(f"Could not probe {gitea_url} for its max page size: {e}")
+        limit = default
+
+    with _page_limit_lock:
+        _page_limit_cache[gitea_url] = limit
+    return limit
+
+
+# ETag cache shared by every API client in this process. The mirror service
+# is long-running (the web UI re-syncs repositories on a schedule), so pages
+# that have not changed between runs are revalidated with If-None-Match and
+# served from here on a 304. GitHub does not charge rate-limit quota for
+# 304 responses, making repeat syncs of unchanged data almost free.
+# Each entry holds a full parsed document, so the cache is bounded and
+# evicts least-recently-used entries; unbounded it would grow with every
+# page of every repo the long-running service ever syncs.
+_etag_cache = OrderedDict()
+_etag_lock = threading.Lock()
+ETAG_CACHE_MAX_ENTRIES = 1024
+
+
+# Pause before the GitHub quota runs out rather than erroring on it
+RATE_LIMIT_FLOOR = 10
+
+
+def _respect_rate_limit(response):
+    """Sleep through a GitHub rate-limit window before it is exhausted
+
+    Multi-repo runs can burn through the hourly quota mid-sync, turning
+    later requests into hard 403 failures. When the remaining budget in
+    the response headers drops below the floor, wait until the
+    advertised reset instead so the run finishes slowly rather than
+    aborting. Responses without rate-limit headers (Gitea, mocks) are
+    left alone.
+    """
+    try:
+        remaining = int(response.headers.get('X-RateLimit-Remaining', ''))
+        reset = int(response.headers.get('X-RateLimit-Reset', ''))
+    except (TypeError, ValueError):
+        return
+    if remaining >= RATE_LIMIT_FLOOR:
+        return
+    wait = reset - time.time() + 1
+    if wait > 0:
+        logger.warning(f"Rate limit nearly exhausted ({remaining} requests left), sleeping {wait:.0f}s until reset")
+        time.sleep(wait)
+
+
+# Run the check on every response that passes through the shared
+# session, so plain wrapper calls (asset downloads, Gitea writes) get
+# the same protection as the cached JSON fetches
+_session.hooks['response'].append(lambda response, *args, **kwargs: _respect_rate_limit(response))
+
+
+def get_json_cached(url, headers=None, params=None):
+    """GET a JSON document, revalidating any cached copy with If-None-Match
+
+    Returns a (data, response) tuple so callers can still inspect response
+    headers such as Link pagination. Raises for non-2xx statuses other than
+    304, which is answered from the cache.
+    """
+    cache_key = (url, tuple(sorted((params or {}).items())))
+    with _etag_lock:
+        cached = _etag_cache.get(cache_key)
+        if cached is not None:
+            _etag_cache.move_to_end(cache_key)
+
+    request_headers = dict(headers or {})
+    if cached:
+        request_headers['If-None-Match'] = cached[0]
+
+    response = get(url, headers=request_headers, params=params)
+
+    # GitHub's secondary rate limit answers 403 with a Retry-After
+    # header; honour it once and repeat the request rather than failing
+    # the whole sync (the primary hourly limit is handled by the session
+    # hook from the X-RateLimit headers before it is ever exhausted)
+    retry_after = response.headers.get('Retry-After')
+    if response.status_code in (403, 429) and retry_after:
+        try:
+            delay = int(retry_after)
+        except (TypeError, ValueError):
+            delay = 60
+        logger.warning(f"Secondary rate limit hit for {url}, retrying after {delay}s")
+        time.sleep(delay)
+        response = get(url, headers=request_headers, params=params)
+
+    if cached and response.status_code == 304:
+        logger.debug(f"Cache hit for {url} (ETag match)")
+        return cached[1], response
+
+    response.raise_for_status()
+    data = decode_json(response)
+
+    etag = response.headers.get('ETag')
+    if etag:
+        with _etag_lock:
+            _etag_cache[cache_key] = (etag, data)
+            _etag_cache.move_to_end(cache_key)
+            while len(_etag_cache) > ETAG_CACHE_MAX_ENTRIES:
+                _etag_cache.popitem(last=False)
+
+    return data, response
+
+
+def _has_next_page(response, page_items, page_size):
+    """Decide whether a paginated listing has another page to fetch
+
+    The Link rel="next" header is authoritative and avoids the wasted
+    empty-page request the old size sentinel needed when the last page was
+    exactly full. Cached 304 replies may omit Link headers, so those fall
+    back to the size sentinel.
+    """
+    if response.status_code == 304:
+        return len(page_items) == page_size
+    return bool(response.links.get('next'))
+
+
+def get_last_page_number(response):
+    """Extract the last page number from a paginated response's Link header"""
+    last_url = response.links.get('last', {}).get('url')
+    if not last_url:
+        return 1
+    try:
+        return int(parse_qs(urlparse(last_url).query)['page'][0])
+    except (KeyError, ValueError, IndexError):
+        return 1
+
+
+def iter_pages(api_url, headers, params):
+    """Yield each page of a paginated API listing as it arrives
+
+    The first page is fetched on its own so the Link header can tell us how
+    many pages exist; any remaining pages are then fetched concurrently so
+    the total wall time is close to a single round-trip instead of one
+    round-trip per page. Servers that don't advertise a last page fall back
+    to sequential paging.
+
+    Yielding pages as they arrive lets callers start processing the first
+    items immediately instead of waiting for the full listing to be
+    buffered in memory.
+    """
+    page_size = params.get('per_page') or params.get('limit') or 50
+    first_page, response = get_json_cached(api_url, headers=headers, params=dict(params, page=1))
+    if not first_page:
+        return
+
+    last_page = get_last_page_number(response)
+
+    if last_page > 1:
+        yield first_page
+
+        def fetch_page(page):
+            page_items, _ = get_json_cached(api_url, headers=headers, params=dict(params, page=page))
+            return page_items
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PAGE_WORKERS, last_page - 1)) as executor:
+            for page_items in executor.map(fetch_page, range(2, last_page + 1)):
+                yield page_items
+    else:
+        # No rel="last" link to fan out on; follow rel="next" sequentially,
+        # starting each fetch before handing the current page to the caller
+        # so the next round-trip is hidden behind the caller's processing
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = 2
+            page_items = first_page
+            while True:
+                future = None
+                if _has_next_page(response, page_items, page_size):
+                    future = executor.submit(get_json_cached, api_url, headers=headers, params=dict(params, page=page))
+                yield page_items
+                if future is None:
+                    break
+                page_items, response = future.result()
+                if not page_items:
+                    break
+                page += 1
+
+
+def fetch_all_pages(api_url, headers, params):
+    """Fetch every page of a paginated API listing into a single list"""
+    all_items = []
+    for page_items in iter_pages(api_url, headers, params):
+        all_items.extend(page_items)
+    return all_items
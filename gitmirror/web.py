@@ -21,7 +21,7 @@ from .utils.config import (
     get_all_repo_configs,
     get_config_dir
 )
-from .gitea.repository import get_gitea_repos, check_repo_exists, is_repo_mirror, is_repo_empty, create_or_update_repo
+from .gitea.repository import get_gitea_repos, get_repo_info, is_repo_empty, create_or_update_repo
 from .gitea.metadata import mirror_github_metadata, delete_all_issues_and_prs
 from .mirror import mirror_repository, process_all_repositories
 
@@ -646,12 +646,15 @@ def add_repository():
                 flash("Repository successfully added! You can now trigger a mirror manually or wait for the next scheduled mirror.", "success")
                 return redirect(url_for('repo_config', gitea_owner=gitea_owner, gitea_repo=gitea_repo))
             else:
-                # Check if the repository exists but is not a mirror
-                repo_exists = check_repo_exists(gitea_token, gitea_url, gitea_owner, gitea_repo)
+                # Check if the repository exists but is not a mirror;
+                # one repo fetch answers all three questions
+                repo_info = get_repo_info(gitea_token, gitea_url, gitea_owner, gitea_repo)
                 
-                if repo_exists:
-                    is_mirror = is_repo_mirror(gitea_token, gitea_url, gitea_owner, gitea_repo)
-                    is_empty = is_repo_empty(gitea_token, gitea_url, gitea_owner, gitea_repo)
+                if repo_info['exists']:
+                    is_mirror = repo_info['mirror']
+                    is_empty = repo_info['empty']
+                    if is_empty is None:
+                        is_empty = is_repo_empty(gitea_token, gitea_url, gitea_owner, gitea_repo)
                     
                     if not is_mirror and is_empty:
                         flash("Repository exists but is not a mirror. You can force recreate it as a mirror.", "warning")
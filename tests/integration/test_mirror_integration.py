@@ -106,13 +106,15 @@ class TestMirrorIntegration:
         assert 'last_mirror_timestamp' in updated_config
         assert 'last_mirror_date' in updated_config
     
-    @patch('gitmirror.gitea.issue.requests.get')
-    @patch('gitmirror.gitea.issue.requests.post')
-    def test_issues_mirroring_integration(self, mock_post, mock_get, temp_config_dir):
+    @patch('gitmirror.gitea.issue.http.get_gitea_page_limit', return_value=50)
+    @patch('gitmirror.gitea.issue.http.get')
+    @patch('gitmirror.gitea.issue.http.post')
+    def test_issues_mirroring_integration(self, mock_post, mock_get, mock_page_limit, temp_config_dir):
         """Test the integration of GitHub issues API with Gitea issues API."""
         # Set up GitHub API mock
         github_response = MagicMock()
         github_response.status_code = 200
+        github_response.links = {}
         github_response.json.return_value = [
             {
                 'number': 1,
@@ -127,7 +129,8 @@ class TestMirrorIntegration:
                 'html_url': 'https://github.com/owner/repo/issues/1',
                 'milestone': None,
                 'assignees': [],
-                'closed_at': None
+                'closed_at': None,
+                'comments': 1
             }
         ]
         
@@ -153,7 +156,11 @@ class TestMirrorIntegration:
         gitea_issues_response.json.return_value = []  # No existing issues
         
         # Configure mocks
-        mock_get.side_effect = [github_response, gitea_issues_response, github_comments_response, gitea_issues_response]
+        # http.get is shared with the comment module, so the side effects
+        # cover the existing Gitea issues, the GitHub issue listing and
+        # the GitHub comment listing in order; the post-mirroring
+        # breakdown is derived from counters and makes no request
+        mock_get.side_effect = [gitea_issues_response, github_response, github_comments_response]
         mock_post.return_value = gitea_response
         
         # Set environment variables
@@ -174,12 +181,14 @@ class TestMirrorIntegration:
         os.environ.pop('GITEA_TOKEN', None)
         os.environ.pop('GITEA_URL', None)
     
-    @patch('gitmirror.gitea.repository.requests.get')
+    @patch('gitmirror.gitea.repository.http.get')
     def test_repo_config_integration(self, mock_get, temp_config_dir):
         """Test the integration of repo config with Gitea API."""
         # Set up mock
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.headers = {}
         mock_response.json.return_value = [
             {
                 'id': 1,
@@ -11,13 +11,15 @@ from gitmirror.gitea.repository import get_gitea_repos
 class TestGiteaApi:
     """Test cases for Gitea API functionality."""
 
-    @patch('gitmirror.gitea.issue.requests.get')
-    @patch('gitmirror.gitea.issue.requests.post')
-    def test_mirror_github_issues(self, mock_post, mock_get):
+    @patch('gitmirror.gitea.issue.http.get_gitea_page_limit', return_value=50)
+    @patch('gitmirror.gitea.issue.http.get')
+    @patch('gitmirror.gitea.issue.http.post')
+    def test_mirror_github_issues(self, mock_post, mock_get, mock_page_limit):
         """Test mirroring issues from GitHub to Gitea."""
         # Set up mock for GitHub API
         github_response = MagicMock()
         github_response.status_code = 200
+        github_response.links = {}
         github_response.json.return_value = [
             {
                 'number': 1,
@@ -50,7 +52,9 @@ class TestGiteaApi:
         github_comments_response.json.return_value = []
 
         # Configure mocks
-        mock_get.side_effect = [github_response, github_comments_response]
+        # The existing Gitea issues are listed before the GitHub issues
+        # are streamed, so the empty listing comes first
+        mock_get.side_effect = [github_comments_response, github_response]
         mock_post.return_value = gitea_response
 
         # Call the function
@@ -59,8 +63,8 @@ class TestGiteaApi:
         # Assertions
         assert result == True
 
-    @patch('gitmirror.gitea.metadata.requests.get')
-    @patch('gitmirror.gitea.metadata.requests.post')
+    @patch('gitmirror.gitea.metadata.http.get')
+    @patch('gitmirror.gitea.metadata.http.post')
     def test_mirror_github_labels(self, mock_post, mock_get):
         """Test mirroring labels from GitHub to Gitea."""
         # Set up mock for GitHub API
@@ -99,13 +103,14 @@ class TestGiteaApi:
         # Assertions
         assert result == True
 
-    @patch('gitmirror.gitea.metadata.requests.get')
-    @patch('gitmirror.gitea.metadata.requests.post')
+    @patch('gitmirror.gitea.metadata.http.get')
+    @patch('gitmirror.gitea.metadata.http.post')
     def test_mirror_github_milestones(self, mock_post, mock_get):
         """Test mirroring milestones from GitHub to Gitea."""
         # Set up mock for GitHub API
         github_response = MagicMock()
         github_response.status_code = 200
+        github_response.links = {}
         github_response.json.return_value = [
             {
                 'title': 'v1.0',
@@ -141,12 +146,12 @@ class TestGiteaApi:
         # Assertions
         assert result == True
 
-    @patch('gitmirror.gitea.release.check_gitea_release_exists')
-    @patch('gitmirror.gitea.release.requests.post')
-    def test_create_gitea_release(self, mock_post, mock_check_exists):
+    @patch('gitmirror.gitea.release._get_release_by_tag')
+    @patch('gitmirror.gitea.release.http.post')
+    def test_create_gitea_release(self, mock_post, mock_get_release):
         """Test creating a release in Gitea."""
         # Set up mocks
-        mock_check_exists.return_value = False
+        mock_get_release.return_value = None
 
         mock_response = MagicMock()
         mock_response.status_code = 201
@@ -178,12 +183,12 @@ class TestGiteaApi:
         mock_post.assert_called_once()
         assert mock_post.call_args[1]['json']['tag_name'] == 'v1.0.0'
 
-    @patch('gitmirror.gitea.release.check_gitea_release_exists')
-    @patch('gitmirror.gitea.release.requests.post')
-    def test_create_gitea_release_error(self, mock_post, mock_check_exists):
+    @patch('gitmirror.gitea.release._get_release_by_tag')
+    @patch('gitmirror.gitea.release.http.post')
+    def test_create_gitea_release_error(self, mock_post, mock_get_release):
         """Test error handling when creating a release in Gitea."""
         # Set up mocks
-        mock_check_exists.return_value = False
+        mock_get_release.return_value = None
 
         mock_response = MagicMock()
         mock_response.status_code = 400
@@ -206,13 +211,15 @@ class TestGiteaApi:
         with pytest.raises(Exception):
             create_gitea_release('token', 'http://gitea.example.com', 'owner', 'repo', release)
 
-    @patch('gitmirror.gitea.repository.requests.get')
+    @patch('gitmirror.gitea.repository.http.get')
     @patch('gitmirror.gitea.repository.get_repo_config')
     def test_get_gitea_repos(self, mock_get_repo_config, mock_get):
         """Test getting repositories from Gitea."""
         # Set up mock
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.headers = {}
         mock_response.json.return_value = [
             {
                 'id': 1,
@@ -240,7 +247,7 @@ class TestGiteaApi:
         assert repos[0]['is_mirror'] == True
         assert repos[0]['mirror_interval'] == '8h0m0s'
 
-    @patch('gitmirror.gitea.repository.requests.get')
+    @patch('gitmirror.gitea.repository.http.get')
     def test_get_gitea_repos_error(self, mock_get):
         """Test error handling when getting repositories from Gitea."""
         # Set up mock
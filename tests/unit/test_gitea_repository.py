@@ -10,13 +10,15 @@ from gitmirror.gitea.repository import get_repo_config
 class TestGiteaRepository:
     """Test cases for Gitea repository functionality."""
 
-    @patch('gitmirror.gitea.repository.requests.get')
+    @patch('gitmirror.gitea.repository.http.get')
     @patch('gitmirror.gitea.repository.get_repo_config')
     def test_get_gitea_repos_success(self, mock_get_repo_config, mock_get):
         """Test getting repositories from Gitea successfully."""
         # Set up mock
         mock_response = MagicMock()
         mock_response.status_code = 200
+        mock_response.links = {}
+        mock_response.headers = {}
         mock_response.json.return_value = [
             {
                 'id': 1,
@@ -50,7 +52,7 @@ class TestGiteaRepository:
         assert repos[0]["github_repo"] == "github_owner1/github_repo1"
         assert repos[0]["is_mirror"] == True
 
-    @patch('gitmirror.gitea.repository.requests.get')
+    @patch('gitmirror.gitea.repository.http.get')
     def test_get_gitea_repos_with_error(self, mock_get):
         """Test getting repositories from Gitea with an error."""
         # Set up mock
@@ -64,7 +66,7 @@ class TestGiteaRepository:
         # Assertions
         assert repos == []
 
-    @patch('gitmirror.gitea.repository.requests.get')
+    @patch('gitmirror.gitea.repository.http.get')
     def test_get_gitea_repos_with_exception(self, mock_get):
         """Test getting repositories from Gitea with an exception."""
         # Set up mock to raise an exception
@@ -76,8 +78,8 @@ class TestGiteaRepository:
         # Assertions
         assert repos == []
 
-    @patch('gitmirror.gitea.repository.requests.patch')
-    @patch('gitmirror.gitea.repository.requests.get')
+    @patch('gitmirror.gitea.repository.http.patch')
+    @patch('gitmirror.gitea.repository.http.get')
     @patch('gitmirror.gitea.repository.get_repo_config')
     def test_create_or_update_repo_existing(self, mock_get_repo_config, mock_get, mock_patch):
         """Test updating an existing Gitea repository."""
@@ -119,10 +121,10 @@ class TestGiteaRepository:
         mock_get_repo_config.return_value = {}
 
         # Mock the delete and post requests
-        with patch('gitmirror.gitea.repository.requests.delete') as mock_delete:
+        with patch('gitmirror.gitea.repository.http.delete') as mock_delete:
             mock_delete.return_value = mock_delete_response
             
-            with patch('gitmirror.gitea.repository.requests.post') as mock_post:
+            with patch('gitmirror.gitea.repository.http.post') as mock_post:
                 mock_post.return_value = mock_post_response
                 
                 # Call the function with force_recreate=True
@@ -149,8 +151,8 @@ class TestGiteaRepository:
         assert "description" in json_payload
         assert "Mirror of github_owner/github_repo" in json_payload["description"]
 
-    @patch('gitmirror.gitea.repository.requests.post')
-    @patch('gitmirror.gitea.repository.requests.get')
+    @patch('gitmirror.gitea.repository.http.post')
+    @patch('gitmirror.gitea.repository.http.get')
     def test_create_or_update_repo_new(self, mock_get, mock_post):
         """Test creating a new Gitea repository."""
         # Set up mock responses
@@ -186,7 +188,7 @@ class TestGiteaRepository:
         assert "description" in json_payload
         assert "Mirror of github_owner/github_repo" in json_payload["description"]
 
-    @patch('gitmirror.gitea.repository.requests.post')
+    @patch('gitmirror.gitea.repository.http.post')
     def test_trigger_mirror_sync_success(self, mock_post):
         """Test triggering mirror sync successfully."""
         # Set up mock
@@ -207,7 +209,7 @@ class TestGiteaRepository:
         assert kwargs['headers']['Authorization'] == 'token token'
         assert kwargs['headers']['Content-Type'] == 'application/json'
 
-    @patch('gitmirror.gitea.repository.requests.post')
+    @patch('gitmirror.gitea.repository.http.post')
     def test_trigger_mirror_sync_failure(self, mock_post):
         """Test triggering mirror sync with a failure."""
         # Set up mock
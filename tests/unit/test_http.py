@@ -0,0 +1,116 @@
+import pytest
+from unittest.mock import patch, MagicMock
+from gitmirror.utils import http
+
+class TestHttpHelpers:
+    """Test cases for the shared HTTP helpers."""
+
+    def test_get_last_page_number_parses_last_link(self):
+        """Test extracting the last page number from a Link header."""
+        response = MagicMock()
+        response.links = {'last': {'url': 'https://api.github.com/repos/owner/repo/issues?per_page=100&page=7'}}
+
+        assert http.get_last_page_number(response) == 7
+
+    def test_get_last_page_number_without_last_link(self):
+        """Test that a response without a rel=last link counts as one page."""
+        response = MagicMock()
+        response.links = {}
+
+        assert http.get_last_page_number(response) == 1
+
+    def test_get_last_page_number_with_unparseable_url(self):
+        """Test that a rel=last link without a page parameter counts as one page."""
+        response = MagicMock()
+        response.links = {'last': {'url': 'https://api.github.com/repos/owner/repo/issues'}}
+
+        assert http.get_last_page_number(response) == 1
+
+    @patch('gitmirror.utils.http.get_json_cached')
+    def test_iter_pages_fans_out_on_last_link(self, mock_get_json_cached):
+        """Test that a rel=last link triggers one fetch per remaining page."""
+        first_response = MagicMock()
+        first_response.status_code = 200
+        first_response.links = {'last': {'url': 'https://example.com/items?page=3'}}
+
+        later_response = MagicMock()
+        later_response.status_code = 200
+        later_response.links = {}
+
+        def fetch_page(url, headers=None, params=None):
+            page = params['page']
+            if page == 1:
+                return [1, 2], first_response
+            return [page * 10], later_response
+
+        mock_get_json_cached.side_effect = fetch_page
+
+        pages = list(http.iter_pages('https://example.com/items', {}, {'per_page': 2}))
+
+        # Pages arrive in order even though 2 and 3 were fetched concurrently
+        assert pages == [[1, 2], [20], [30]]
+        assert mock_get_json_cached.call_count == 3
+
+    @patch('gitmirror.utils.http.get_json_cached')
+    def test_iter_pages_sequential_fallback(self, mock_get_json_cached):
+        """Test following rel=next sequentially when no rel=last link exists."""
+        first_response = MagicMock()
+        first_response.status_code = 200
+        first_response.links = {'next': {'url': 'https://example.com/items?page=2'}}
+
+        last_response = MagicMock()
+        last_response.status_code = 200
+        last_response.links = {}
+
+        def fetch_page(url, headers=None, params=None):
+            if params['page'] == 1:
+                return [1, 2], first_response
+            return [3], last_response
+
+        mock_get_json_cached.side_effect = fetch_page
+
+        pages = list(http.iter_pages('https://example.com/items', {}, {'per_page': 2}))
+
+        assert pages == [[1, 2], [3]]
+        assert mock_get_json_cached.call_count == 2
+
+    @patch('gitmirror.utils.http.get_json_cached')
+    def test_iter_pages_empty_first_page(self, mock_get_json_cached):
+        """Test that an empty listing stops after a single request."""
+        response = MagicMock()
+        response.status_code = 200
+        response.links = {}
+        mock_get_json_cached.return_value = ([], response)
+
+        pages = list(http.iter_pages('https://example.com/items', {}, {'per_page': 2}))
+
+        assert pages == []
+        assert mock_get_json_cached.call_count == 1
+
+    @patch('gitmirror.utils.http.get')
+    def test_get_json_cached_serves_304_from_cache(self, mock_get):
+        """Test that a 304 revalidation is answered from the ETag cache."""
+        url = 'https://api.github.com/repos/owner/repo/etag-test'
+
+        fresh_response = MagicMock()
+        fresh_response.status_code = 200
+        fresh_response.headers = {'ETag': '"abc"'}
+        fresh_response.content = b'[1, 2, 3]'
+        fresh_response.json.return_value = [1, 2, 3]
+
+        revalidated_response = MagicMock()
+        revalidated_response.status_code = 304
+        revalidated_response.headers = {}
+
+        mock_get.side_effect = [fresh_response, revalidated_response]
+
+        data, _ = http.get_json_cached(url, headers={}, params={'page': 1})
+        assert data == [1, 2, 3]
+
+        data, response = http.get_json_cached(url, headers={}, params={'page': 1})
+        assert data == [1, 2, 3]
+        assert response.status_code == 304
+
+        # The revalidation request carried the stored ETag
+        sent_headers = mock_get.call_args[1]['headers']
+        assert sent_headers['If-None-Match'] == '"abc"'